@@ -20,6 +20,9 @@ console = Console()
 _OPENCLAW_GLOBAL_ARGS: ContextVar[tuple[str, ...]] = ContextVar(
     "openclaw_global_args", default=()
 )
+_OPENCLAW_SERVICE: ContextVar[ProviderHostService | None] = ContextVar(
+    "openclaw_service", default=None
+)
 
 _FORWARD_CONTEXT = {
     "allow_extra_args": True,
@@ -39,6 +42,16 @@ def _current_global_args() -> list[str]:
     return list(_OPENCLAW_GLOBAL_ARGS.get())
 
 
+def _provider_host() -> ProviderHostService:
+    """Return the provider host service shared by this OpenClaw invocation."""
+
+    service = _OPENCLAW_SERVICE.get()
+    if service is None:
+        service = ProviderHostService()
+        _OPENCLAW_SERVICE.set(service)
+    return service
+
+
 def _uses_isolated_openclaw_profile() -> bool:
     """Return True when root flags select a non-default OpenClaw state tree."""
 
@@ -94,6 +107,7 @@ def main(
     if no_color:
         global_args.append("--no-color")
     _OPENCLAW_GLOBAL_ARGS.set(tuple(global_args))
+    _OPENCLAW_SERVICE.set(None)
 
     if version:
         _run_openclaw(["--version"])
@@ -117,7 +131,7 @@ def _run_openclaw(
 ) -> None:
     """Run an OpenClaw command in the provider-aware cloud container."""
 
-    service = ProviderHostService()
+    service = _provider_host()
     forwarded_args = [*_current_global_args(), *args]
     exit_code = service.run_provider_command(
         "openclaw",
@@ -139,7 +153,7 @@ def _run_openclaw_shell(
 ) -> None:
     """Run a composed OpenClaw shell command in the provider-aware container."""
 
-    service = ProviderHostService()
+    service = _provider_host()
     exit_code = service.run_provider_shell_command(
         "openclaw",
         command,
@@ -156,7 +170,7 @@ def _openclaw_command(args: list[str]) -> str:
 
 
 def _openclaw_setup_state() -> str:
-    return ProviderHostService().get_status("openclaw").setup_state
+    return _provider_host().get_status("openclaw").setup_state
 
 
 def _gateway_args(
@@ -2,29 +2,71 @@
 CLI Tools management commands for cuti.
 """
 
+import functools
 import os
+import re
 import subprocess
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import typer
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from ...services.instructions import update_instruction_files_with_tools
 from ...services.tool_catalog import (
     AVAILABLE_TOOLS,
     check_tool_installed,
+    find_tool,
     load_tools_config,
+    resolve_check_argv,
     save_tools_config,
 )
 
 app = typer.Typer(help="CLI tools management commands")
 console = Console()
 
+# Catalog install commands run as a whole under `sudo -E bash -c`, so each
+# inner `sudo` word is dropped; `\b` keeps words like "visudo" intact.
+_SUDO_PATTERN = re.compile(r"\bsudo\s+")
+
+
+@functools.cache
+def _is_installed(check_command: str) -> bool:
+    """Probe a tool at most once per CLI invocation."""
+
+    return check_tool_installed(check_command)
+
+
+def _probe_tools(tool_defs: Iterable[Mapping[str, str]]) -> dict[str, bool]:
+    """Return installed state keyed by tool name.
+
+    Probes are in-process PATH lookups, so they run serially.
+    """
+
+    return {t["name"]: _is_installed(t["check_command"]) for t in tool_defs}
+
+
+def _tool_version(tool: Mapping[str, str]) -> str | None:
+    """Return the first line of a tool's version output, or None if missing."""
+
+    argv = resolve_check_argv(tool["check_command"])
+    if argv is None:
+        return None
+    try:
+        result = subprocess.run(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            timeout=2
+        )
+    except Exception:
+        return "installed"
+    return result.stdout.strip().split('\n')[0] if result.stdout else "installed"
+
 
 def update_claude_md(tools: list[dict[str, Any]]) -> None:
     """Update provider instruction files with enabled tools information."""
@@ -35,6 +77,35 @@ def update_claude_md(tools: list[dict[str, Any]]) -> None:
         console.print(f"[yellow]Warning: Could not update instruction files: {e}[/yellow]")
 
 
+def _refresh_claude_md(
+    enabled_tools: set[str], known_installed: Mapping[str, bool] | None = None
+) -> None:
+    """Rebuild the instruction-file tool section from the enabled tools.
+
+    Tools listed in ``known_installed`` reuse that state instead of being probed.
+    """
+
+    known_installed = known_installed or {}
+    # Only enabled tools appear in the section, so only those need probing.
+    enabled_defs = [t for t in AVAILABLE_TOOLS if t["name"] in enabled_tools]
+    installed_by_name = _probe_tools(
+        t for t in enabled_defs if t["name"] not in known_installed
+    )
+    installed_by_name.update(known_installed)
+    update_claude_md(
+        [
+            {
+                "display_name": t["display_name"],
+                "description": t["description"],
+                "usage_instructions": t["usage_instructions"],
+                "enabled": True,
+                "installed": installed_by_name[t["name"]],
+            }
+            for t in enabled_defs
+        ]
+    )
+
+
 @app.command("list")
 def list_tools(
     category: str | None = typer.Option(None, "--category", "-c", help="Filter by category"),
@@ -42,22 +113,27 @@ def list_tools(
     enabled: bool | None = typer.Option(None, "--enabled", help="Show only enabled tools"),
 ) -> None:
     """List available CLI tools and their status."""
+    from rich import box
+    from rich.table import Table
+
     config = load_tools_config()
+    enabled_names = set(config.get("enabled_tools", []))
+    auto_install_names = set(config.get("auto_install", []))
+    # Filter on static catalog fields first so only surviving tools are probed
+    candidates = [
+        tool
+        for tool in AVAILABLE_TOOLS
+        if not category or tool["category"].lower() == category.lower()
+    ]
+    installed_by_name = _probe_tools(candidates)
 
     # Create categories dict for grouping
-    categories: dict[str, list[dict[str, Any]]] = {}
-    for tool_def in AVAILABLE_TOOLS:
-        tool: dict[str, Any] = tool_def.copy()
-        tool["enabled"] = tool["name"] in config.get("enabled_tools", [])
-        tool["auto_install"] = tool["name"] in config.get("auto_install", [])
-        tool["installed"] = check_tool_installed(tool["check_command"])
-
+    categories: dict[str, list[Mapping[str, str]]] = {}
+    for tool in candidates:
         # Apply filters
-        if category and tool["category"].lower() != category.lower():
+        if installed is not None and installed_by_name[tool["name"]] != installed:
             continue
-        if installed is not None and tool["installed"] != installed:
-            continue
-        if enabled is not None and tool["enabled"] != enabled:
+        if enabled is not None and (tool["name"] in enabled_names) != enabled:
             continue
 
         # Group by category
@@ -86,9 +162,9 @@ def list_tools(
         table.add_column("Auto", justify="center", width=8)
 
         for tool in tools:
-            status = "[green]✓ Installed[/green]" if tool["installed"] else "[dim]Not installed[/dim]"
-            enabled_mark = "[green]✓[/green]" if tool["enabled"] else "[dim]-[/dim]"
-            auto_mark = "[blue]✓[/blue]" if tool["auto_install"] else "[dim]-[/dim]"
+            status = "[green]✓ Installed[/green]" if installed_by_name[tool["name"]] else "[dim]Not installed[/dim]"
+            enabled_mark = "[green]✓[/green]" if tool["name"] in enabled_names else "[dim]-[/dim]"
+            auto_mark = "[blue]✓[/blue]" if tool["name"] in auto_install_names else "[dim]-[/dim]"
 
             table.add_row(
                 tool["display_name"],
@@ -113,15 +189,13 @@ def install_tool(
     scope: str = typer.Option("container", "--scope", "-s", help="Installation scope: workspace|container|system"),
 ) -> None:
     """Install a CLI tool with specified scope (workspace, container, or system)."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     # Import workspace tools manager
     from ...services.workspace_tools import WorkspaceToolsManager
 
     # Find the tool
-    tool: dict[str, Any] | None = None
-    for t in AVAILABLE_TOOLS:
-        if t["name"] == tool_name or t["display_name"].lower() == tool_name.lower():
-            tool = t
-            break
+    tool = find_tool(tool_name)
 
     if not tool:
         console.print(f"[red]Tool '{tool_name}' not found[/red]")
@@ -140,7 +214,7 @@ def install_tool(
         ) as progress:
             task = progress.add_task(f"Installing {tool['display_name']} to workspace...", total=None)
 
-            workspace_result = manager.install_tool_for_workspace(tool["name"], tool, scope="workspace")
+            workspace_result = manager.install_tool_for_workspace(tool["name"], dict(tool), scope="workspace")
             progress.update(task, completed=True)
 
             if workspace_result["success"]:
@@ -166,7 +240,7 @@ def install_tool(
         raise typer.Exit(1)
 
     # Check if already installed
-    if check_tool_installed(tool["check_command"]):
+    if _is_installed(tool["check_command"]):
         console.print(f"[green]✓ {tool['display_name']} is already installed[/green]")
 
         # Update configuration if needed
@@ -202,8 +276,8 @@ def install_tool(
             install_cmd = tool["install_command"]
 
             # Handle sudo commands properly
-            if "sudo" in install_cmd:
-                install_cmd = install_cmd.replace("sudo ", "")
+            if _SUDO_PATTERN.search(install_cmd):
+                install_cmd = _SUDO_PATTERN.sub("", install_cmd)
                 cmd_list = ["sudo", "-E", "bash", "-c", install_cmd]
                 result = subprocess.run(
                     cmd_list,
@@ -241,14 +315,8 @@ def install_tool(
                 config["auto_install"] = list(auto_install_tools)
                 save_tools_config(config)
 
-                # Update CLAUDE.md
-                all_tools: list[dict[str, Any]] = []
-                for t in AVAILABLE_TOOLS:
-                    t_copy: dict[str, Any] = t.copy()
-                    t_copy["enabled"] = t["name"] in enabled_tools
-                    t_copy["installed"] = check_tool_installed(t["check_command"])
-                    all_tools.append(t_copy)
-                update_claude_md(all_tools)
+                # Update CLAUDE.md; the install just succeeded, so skip re-probing it
+                _refresh_claude_md(enabled_tools, {tool["name"]: True})
 
                 console.print(f"\n[cyan]Usage:[/cyan] {tool['usage_instructions']}")
             else:
@@ -274,18 +342,14 @@ def enable_tool(
 ) -> None:
     """Enable a CLI tool (mark it as available for use)."""
     # Find the tool
-    tool: dict[str, Any] | None = None
-    for t in AVAILABLE_TOOLS:
-        if t["name"] == tool_name or t["display_name"].lower() == tool_name.lower():
-            tool = t
-            break
+    tool = find_tool(tool_name)
 
     if not tool:
         console.print(f"[red]Tool '{tool_name}' not found[/red]")
         raise typer.Exit(1)
 
     # Check if installed
-    if not check_tool_installed(tool["check_command"]):
+    if not _is_installed(tool["check_command"]):
         console.print(f"[yellow]⚠ {tool['display_name']} is not installed[/yellow]")
         if typer.confirm("Install it now?"):
             install_tool(tool_name, enable=True, auto=auto)
@@ -311,13 +375,7 @@ def enable_tool(
         console.print(f"[green]✓ Auto-install enabled for {tool['display_name']}[/green]")
 
     # Update CLAUDE.md
-    all_tools: list[dict[str, Any]] = []
-    for t in AVAILABLE_TOOLS:
-        t_copy: dict[str, Any] = t.copy()
-        t_copy["enabled"] = t["name"] in enabled_tools
-        t_copy["installed"] = check_tool_installed(t["check_command"])
-        all_tools.append(t_copy)
-    update_claude_md(all_tools)
+    _refresh_claude_md(enabled_tools)
 
 
 @app.command("disable")
@@ -326,11 +384,7 @@ def disable_tool(
 ) -> None:
     """Disable a CLI tool (unmark it from available tools)."""
     # Find the tool
-    tool: dict[str, Any] | None = None
-    for t in AVAILABLE_TOOLS:
-        if t["name"] == tool_name or t["display_name"].lower() == tool_name.lower():
-            tool = t
-            break
+    tool = find_tool(tool_name)
 
     if not tool:
         console.print(f"[red]Tool '{tool_name}' not found[/red]")
@@ -351,13 +405,7 @@ def disable_tool(
     console.print(f"[green]✓ {tool['display_name']} disabled[/green]")
 
     # Update CLAUDE.md
-    all_tools: list[dict[str, Any]] = []
-    for t in AVAILABLE_TOOLS:
-        t_copy: dict[str, Any] = t.copy()
-        t_copy["enabled"] = t["name"] in enabled_tools
-        t_copy["installed"] = check_tool_installed(t["check_command"])
-        all_tools.append(t_copy)
-    update_claude_md(all_tools)
+    _refresh_claude_md(enabled_tools)
 
 
 @app.command("info")
@@ -365,12 +413,11 @@ def tool_info(
     tool_name: str = typer.Argument(..., help="Name of the tool to show info for"),
 ) -> None:
     """Show detailed information about a tool."""
+    from rich import box
+    from rich.panel import Panel
+
     # Find the tool
-    tool: dict[str, Any] | None = None
-    for t in AVAILABLE_TOOLS:
-        if t["name"] == tool_name or t["display_name"].lower() == tool_name.lower():
-            tool = t
-            break
+    tool = find_tool(tool_name)
 
     if not tool:
         console.print(f"[red]Tool '{tool_name}' not found[/red]")
@@ -378,7 +425,7 @@ def tool_info(
 
     # Check status
     config = load_tools_config()
-    is_installed = check_tool_installed(tool["check_command"])
+    is_installed = _is_installed(tool["check_command"])
     is_enabled = tool["name"] in config.get("enabled_tools", [])
     is_auto = tool["name"] in config.get("auto_install", [])
 
@@ -445,12 +492,15 @@ def setup_auto_activation() -> None:
     # Add to shell initialization files
     activation_line = f"\n# Cuti workspace tools auto-activation\n[ -f {auto_activate_dest} ] && source {auto_activate_dest}\n"
 
+    marker = str(auto_activate_dest)
     shells_updated = []
     for shell_rc in [Path.home() / ".bashrc", Path.home() / ".zshrc"]:
         if shell_rc.exists():
-            content = shell_rc.read_text()
-            if str(auto_activate_dest) not in content:
-                shell_rc.write_text(content + activation_line)
+            with shell_rc.open() as handle:
+                configured = any(marker in line for line in handle)
+            if not configured:
+                with shell_rc.open("a") as handle:
+                    handle.write(activation_line)
                 shells_updated.append(shell_rc.name)
 
     if shells_updated:
@@ -465,6 +515,10 @@ def setup_auto_activation() -> None:
 @app.command("workspace")
 def workspace_tools() -> None:
     """Show workspace-specific tools configuration and status."""
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
     from ...services.workspace_tools import WorkspaceToolsManager
 
     manager = WorkspaceToolsManager()
@@ -522,23 +576,13 @@ def check_tools() -> None:
     installed_count = 0
     total_count = len(AVAILABLE_TOOLS)
 
-    for tool in AVAILABLE_TOOLS:
-        is_installed = check_tool_installed(tool["check_command"])
-        if is_installed:
+    with ThreadPoolExecutor(max_workers=min(16, total_count)) as pool:
+        versions = list(pool.map(_tool_version, AVAILABLE_TOOLS))
+
+    for tool, version_info in zip(AVAILABLE_TOOLS, versions, strict=True):
+        if version_info is not None:
             installed_count += 1
-            # Try to get version info
-            try:
-                result = subprocess.run(
-                    tool["check_command"],
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                version_info = result.stdout.strip().split('\n')[0] if result.stdout else "installed"
-                console.print(f"[green]✓[/green] {tool['display_name']}: {version_info}")
-            except Exception:
-                console.print(f"[green]✓[/green] {tool['display_name']}: installed")
+            console.print(f"[green]✓[/green] {tool['display_name']}: {version_info}")
         else:
             console.print(f"[dim]✗[/dim] {tool['display_name']}: not installed")
 
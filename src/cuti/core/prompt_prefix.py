@@ -1,12 +1,16 @@
 """Prompt prefix management for cuti."""
 
+import functools
 import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel
 
 from ..utils.constants import PROMPT_PREFIXES_DIR
+from ..utils.helpers import write_json_atomic
 
 
 class PromptPrefix(BaseModel):
@@ -19,6 +23,35 @@ class PromptPrefix(BaseModel):
     is_active: bool = False
 
 
+@functools.cache
+def _load_templates(templates_dir: Path) -> tuple[Mapping[str, Any], ...]:
+    """Load the bundled templates once; they ship with the package and do not change.
+
+    The cached templates are read-only, with list values stored as tuples.
+    """
+    templates = []
+
+    if templates_dir.exists():
+        for template_file in templates_dir.glob("*.json"):
+            try:
+                template = json.loads(template_file.read_bytes())
+                template['is_template'] = True
+                templates.append(template)
+            except Exception as e:
+                print(f"Error loading template {template_file}: {e}")
+
+    # Sort templates by name for consistency
+    templates.sort(key=lambda x: x.get('name', ''))
+
+    return tuple(
+        MappingProxyType({
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in template.items()
+        })
+        for template in templates
+    )
+
+
 class PromptPrefixManager:
     """Manages prompt prefixes and templates."""
 
@@ -36,39 +69,33 @@ class PromptPrefixManager:
 
     def _ensure_files(self) -> None:
         """Ensure prefix files exist."""
-        if not self.prefix_file.exists():
-            # Create default prefix file with no active prefix
-            self.save_active_prefix(None)
-
-        if not self.custom_prefixes_file.exists():
-            # Create empty custom prefixes file
-            with open(self.custom_prefixes_file, 'w') as f:
-                json.dump([], f)
+        defaults: tuple[tuple[Path, Any], ...] = (
+            # Default prefix file with no active prefix
+            (self.prefix_file, {'active_prefix': None, 'enabled': False}),
+            # Empty custom prefixes file
+            (self.custom_prefixes_file, []),
+        )
+        for path, default in defaults:
+            # Exclusive create: one open() instead of exists() followed by a write
+            try:
+                with open(path, 'x') as f:
+                    json.dump(default, f, indent=2)
+            except FileExistsError:
+                pass
 
     def get_templates(self) -> list[dict[str, Any]]:
         """Get all available templates by loading from JSON files."""
-        templates = []
-
-        if self.templates_dir.exists():
-            for template_file in self.templates_dir.glob("*.json"):
-                try:
-                    with open(template_file) as f:
-                        template = json.load(f)
-                        template['is_template'] = True
-                        templates.append(template)
-                except Exception as e:
-                    print(f"Error loading template {template_file}: {e}")
-
-        # Sort templates by name for consistency
-        templates.sort(key=lambda x: x.get('name', ''))
-
-        return templates
+        # Templates hold only strings, bools and tuples of strings, so rebuilding
+        # each dict and its lists is enough to hand out an independent copy
+        return [
+            {key: list(value) if isinstance(value, tuple) else value for key, value in template.items()}
+            for template in _load_templates(self.templates_dir)
+        ]
 
     def get_custom_prefixes(self) -> list[dict[str, Any]]:
         """Get all custom prefixes."""
         try:
-            with open(self.custom_prefixes_file) as f:
-                return json.load(f)
+            return json.loads(self.custom_prefixes_file.read_bytes())
         except Exception:
             return []
 
@@ -81,14 +108,15 @@ class PromptPrefixManager:
             existing_index = next((i for i, p in enumerate(prefixes) if p['name'] == prefix['name']), None)
 
             if existing_index is not None:
+                if prefixes[existing_index] == prefix:
+                    return True  # Already saved as-is
                 # Update existing
                 prefixes[existing_index] = prefix
             else:
                 # Add new
                 prefixes.append(prefix)
 
-            with open(self.custom_prefixes_file, 'w') as f:
-                json.dump(prefixes, f, indent=2)
+            write_json_atomic(self.custom_prefixes_file, prefixes)
 
             return True
         except Exception as e:
@@ -99,10 +127,10 @@ class PromptPrefixManager:
         """Delete a custom prefix."""
         try:
             prefixes = self.get_custom_prefixes()
-            prefixes = [p for p in prefixes if p['name'] != name]
+            remaining = [p for p in prefixes if p['name'] != name]
 
-            with open(self.custom_prefixes_file, 'w') as f:
-                json.dump(prefixes, f, indent=2)
+            if len(remaining) != len(prefixes):
+                write_json_atomic(self.custom_prefixes_file, remaining)
 
             # If this was the active prefix, clear it
             active = self.get_active_prefix()
@@ -116,9 +144,7 @@ class PromptPrefixManager:
     def get_active_prefix(self) -> dict[str, Any] | None:
         """Get the currently active prefix."""
         try:
-            with open(self.prefix_file) as f:
-                data = json.load(f)
-                return data.get('active_prefix')
+            return json.loads(self.prefix_file.read_bytes()).get('active_prefix')
         except Exception:
             return None
 
@@ -130,8 +156,7 @@ class PromptPrefixManager:
                 'enabled': prefix is not None
             }
 
-            with open(self.prefix_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            write_json_atomic(self.prefix_file, data)
 
             return True
         except Exception:
@@ -3,16 +3,95 @@ Claude Account Manager - Manages multiple Claude accounts for container usage.
 Supports Claude Code OAuth, Anthropic API keys, and AWS Bedrock credentials.
 """
 
+import functools
 import json
 import os
+import re
 import shutil
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
 
+from ..utils.helpers import write_json_atomic, write_text_atomic
+
 # Credential types
 CredentialType = Literal["oauth", "anthropic_api", "bedrock_api"]
 
+# Files in the active Claude directory that contain authentication data
+_CREDENTIAL_FILES = frozenset({
+    ".credentials.json",    # Main credentials file
+    ".claude.json",         # Claude configuration (may contain tokens)
+    "session.json",         # Session data
+    ".session",             # Alternative session file
+})
+# Backup or corrupted copies contain both a credential-name part and a backup marker
+_CREDENTIAL_NAME_PART = re.compile(r"\.credentials|\.claude\.json|\.session|session\.json")
+_BACKUP_NAME_PART = re.compile(r"\.backup|\.bak|\.old|\.corrupted")
+_SESSION_DIRS = (
+    "sessions",         # Active sessions
+    "shell-snapshots",  # Shell session snapshots
+    "statsig",          # Analytics/session tracking
+)
+
+# Environment variables cleared when switching accounts
+_ENV_VARS_TO_UNSET = (
+    # Anthropic
+    "ANTHROPIC_API_KEY",
+    # Bedrock
+    "AWS_BEARER_TOKEN_BEDROCK",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_REGION",
+    "AWS_SESSION_TOKEN",
+    # Claude Code Bedrock
+    "CLAUDE_CODE_USE_BEDROCK",
+    "ANTHROPIC_SMALL_FAST_MODEL_AWS_REGION",
+)
+_UNSET_BLOCK = "\n".join(f"unset {var}" for var in _ENV_VARS_TO_UNSET)
+
+# Anything but (Unicode) letters, digits, '_', '-' and ' ' is dropped from account names
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w\- ]+")
+# Below this many files/dirs, copying serially beats starting a thread pool
+_PARALLEL_COPY_MIN = 4
+
+
+def _is_credential_file(name: str) -> bool:
+    """Return True for credential files and their backup/corrupted copies."""
+    if name in _CREDENTIAL_FILES:
+        return True
+    return bool(_CREDENTIAL_NAME_PART.search(name) and _BACKUP_NAME_PART.search(name))
+
+
+def _copy_item(src: Path, dest: Path) -> None:
+    if src.is_dir():
+        shutil.copytree(src, dest)
+    else:
+        shutil.copy2(src, dest)
+
+
+def _copy_items(pairs: list[tuple[Path, Path]]) -> None:
+    """Copy (src, dest) pairs, using a thread pool once there are enough to pay for it."""
+    if len(pairs) < _PARALLEL_COPY_MIN:
+        for src, dest in pairs:
+            _copy_item(src, dest)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as pool:
+        # list() re-raises the first copy error, as the serial loop would
+        list(pool.map(lambda pair: _copy_item(*pair), pairs))
+
+
+@functools.lru_cache(maxsize=64)
+def _read_oauth(creds_path: str, mtime_ns: int) -> dict[str, Any] | None:
+    """Parse the ``claudeAiOauth`` block of a credentials file.
+
+    Keyed by mtime so a rewritten file is parsed again; callers must not
+    mutate the returned dict.
+    """
+    return json.loads(Path(creds_path).read_bytes()).get("claudeAiOauth")
+
 
 class ClaudeAccountManager:
     """Manages multiple Claude Code accounts for container environments."""
@@ -40,17 +119,21 @@ class ClaudeAccountManager:
 
     def _ensure_metadata(self) -> None:
         """Ensure accounts metadata file exists."""
-        if not self.metadata_file.exists():
-            self.metadata_file.write_text(json.dumps({
-                "accounts": {},
-                "active": None,
-                "last_updated": datetime.now().isoformat()
-            }, indent=2))
+        # Exclusive create: one open() instead of exists() followed by a write
+        try:
+            with open(self.metadata_file, "x") as f:
+                f.write(json.dumps({
+                    "accounts": {},
+                    "active": None,
+                    "last_updated": datetime.now().isoformat()
+                }, indent=2))
+        except FileExistsError:
+            pass
 
     def _load_metadata(self) -> dict[str, Any]:
         """Load accounts metadata."""
         try:
-            return json.loads(self.metadata_file.read_text())
+            return json.loads(self.metadata_file.read_bytes())
         except Exception:
             return {
                 "accounts": {},
@@ -58,10 +141,10 @@ class ClaudeAccountManager:
                 "last_updated": datetime.now().isoformat()
             }
 
-    def _save_metadata(self, metadata: dict[str, Any]) -> None:
-        """Save accounts metadata."""
-        metadata["last_updated"] = datetime.now().isoformat()
-        self.metadata_file.write_text(json.dumps(metadata, indent=2))
+    def _save_metadata(self, metadata: dict[str, Any], now_iso: str | None = None) -> None:
+        """Save accounts metadata, stamped with ``now_iso`` when the caller has one."""
+        metadata["last_updated"] = now_iso or datetime.now().isoformat()
+        write_json_atomic(self.metadata_file, metadata)
 
     def list_accounts(self, include_backups: bool = False) -> list[dict[str, Any]]:
         """List all saved Claude accounts.
@@ -71,6 +154,12 @@ class ClaudeAccountManager:
         """
         metadata = self._load_metadata()
         accounts = []
+        # One directory scan instead of an exists() check per account
+        try:
+            with os.scandir(self.accounts_dir) as entries:
+                existing_dirs = {entry.name for entry in entries if entry.is_dir()}
+        except FileNotFoundError:
+            existing_dirs = set()
 
         for name, info in metadata.get("accounts", {}).items():
             # Skip backup accounts unless explicitly requested
@@ -78,25 +167,31 @@ class ClaudeAccountManager:
                 continue
 
             account_dir = self.accounts_dir / name
-            if account_dir.exists():
+            if name in existing_dirs:
                 creds_file = account_dir / ".credentials.json"
                 api_key_file = account_dir / ".api_keys.json"
-                has_oauth_creds = creds_file.exists()
-                has_api_keys = api_key_file.exists()
+                try:
+                    creds_mtime = creds_file.stat().st_mtime_ns
+                except OSError:
+                    creds_mtime = None
+                has_oauth_creds = creds_mtime is not None
+                # OAuth credentials take precedence, so only look for API keys without them
+                has_api_keys = not has_oauth_creds and api_key_file.exists()
 
                 # Check if any credentials exist (OAuth or API keys)
                 has_creds = has_oauth_creds or has_api_keys
 
-                # Try to get account info from credentials
+                # Try to get account info from credentials; the type recorded by
+                # save_account is still valid while the credentials file is unchanged
                 account_type = info.get("type", "unknown")
                 if has_oauth_creds:
-                    try:
-                        creds = json.loads(creds_file.read_text())
-                        if "claudeAiOauth" in creds:
-                            oauth = creds["claudeAiOauth"]
-                            account_type = oauth.get("subscriptionType", "Pro").capitalize()
-                    except Exception:
-                        pass
+                    if info.get("creds_mtime") != creds_mtime:
+                        try:
+                            oauth = _read_oauth(str(creds_file), creds_mtime)
+                            if oauth is not None:
+                                account_type = oauth.get("subscriptionType", "Pro").capitalize()
+                        except Exception:
+                            pass
                 elif has_api_keys:
                     # For API key accounts, show the credential type
                     credential_type = info.get("credential_type", "API")
@@ -129,14 +224,18 @@ class ClaudeAccountManager:
         metadata = self._load_metadata()
         return metadata.get("active")
 
-    def save_account(self, name: str) -> bool:
-        """Save current credentials as a named account."""
+    def save_account(self, name: str, *, move_dirs: Iterable[str] = ()) -> bool:
+        """Save current credentials as a named account.
+
+        Directories named in ``move_dirs`` are moved out of the active directory
+        instead of copied, for callers that are about to clear them anyway.
+        """
         # Validate name
         if not name or not name.strip():
             raise ValueError("Account name cannot be empty")
 
         # Sanitize name for filesystem
-        safe_name = "".join(c for c in name if c.isalnum() or c in ('-', '_', ' ')).strip()
+        safe_name = _UNSAFE_NAME_CHARS.sub("", name).strip()
         if not safe_name:
             raise ValueError("Account name must contain valid characters")
 
@@ -150,26 +249,36 @@ class ClaudeAccountManager:
         account_dir.mkdir(parents=True, exist_ok=True)
 
         # Copy all files from active directory
+        move_dirs = set(move_dirs)
+        copies = []
         for item in self.active_dir.iterdir():
             if item.is_file():
-                shutil.copy2(item, account_dir / item.name)
+                copies.append((item, account_dir / item.name))
             elif item.is_dir():
                 dest_dir = account_dir / item.name
                 if dest_dir.exists():
                     shutil.rmtree(dest_dir)
-                shutil.copytree(item, dest_dir)
+                if item.name in move_dirs:
+                    try:
+                        os.rename(item, dest_dir)
+                        continue
+                    except OSError:
+                        pass  # e.g. cross-device; fall back to copying
+                copies.append((item, dest_dir))
+        _copy_items(copies)
 
         # Update metadata
         metadata = self._load_metadata()
         if "accounts" not in metadata:
             metadata["accounts"] = {}
 
-        # Get account type from credentials
+        # Get account type from the saved copy of the credentials
+        saved_creds = account_dir / ".credentials.json"
+        creds_mtime = saved_creds.stat().st_mtime_ns
         account_type = "Pro"
         try:
-            creds = json.loads(creds_file.read_text())
-            if "claudeAiOauth" in creds:
-                oauth = creds["claudeAiOauth"]
+            oauth = _read_oauth(str(saved_creds), creds_mtime)
+            if oauth is not None:
                 account_type = oauth.get("subscriptionType", "Pro").capitalize()
         except Exception:
             pass
@@ -178,14 +287,16 @@ class ClaudeAccountManager:
         if safe_name in metadata["accounts"]:
             existing_created = metadata["accounts"][safe_name].get("created")
 
+        now_iso = datetime.now().isoformat()
         metadata["accounts"][safe_name] = {
-            "created": existing_created or datetime.now().isoformat(),
-            "last_used": datetime.now().isoformat(),
-            "type": account_type
+            "created": existing_created or now_iso,
+            "last_used": now_iso,
+            "type": account_type,
+            "creds_mtime": creds_mtime
         }
         metadata["active"] = safe_name
 
-        self._save_metadata(metadata)
+        self._save_metadata(metadata, now_iso)
         return True
 
     def use_account(self, name: str) -> bool:
@@ -207,22 +318,23 @@ class ClaudeAccountManager:
                 shutil.rmtree(item)
 
         # Copy account files to active directory
+        copies = []
         for item in account_dir.iterdir():
             if item.is_file():
-                shutil.copy2(item, self.active_dir / item.name)
+                copies.append((item, self.active_dir / item.name))
             elif item.is_dir():
-                dest_dir = self.active_dir / item.name
-                if dest_dir.exists():
-                    shutil.rmtree(dest_dir)
-                shutil.copytree(item, dest_dir)
+                # active_dir was emptied above, so the destination never exists
+                copies.append((item, self.active_dir / item.name))
+        _copy_items(copies)
 
         # Update metadata
         metadata = self._load_metadata()
         metadata["active"] = name
+        now_iso = datetime.now().isoformat()
         if name in metadata.get("accounts", {}):
-            metadata["accounts"][name]["last_used"] = datetime.now().isoformat()
+            metadata["accounts"][name]["last_used"] = now_iso
 
-        self._save_metadata(metadata)
+        self._save_metadata(metadata, now_iso)
         return True
 
     def delete_account(self, name: str) -> bool:
@@ -237,14 +349,18 @@ class ClaudeAccountManager:
 
         # Update metadata
         metadata = self._load_metadata()
+        changed = False
         if name in metadata.get("accounts", {}):
             del metadata["accounts"][name]
+            changed = True
 
         # Clear active if this was the active account
         if metadata.get("active") == name:
             metadata["active"] = None
+            changed = True
 
-        self._save_metadata(metadata)
+        if changed:
+            self._save_metadata(metadata)
         return True
 
     def new_account(self) -> bool:
@@ -253,6 +369,11 @@ class ClaudeAccountManager:
         creds_file = self.active_dir / ".credentials.json"
         backup_needed = creds_file.exists()
 
+        # Session-related directories are emptied below
+        existing_session_dirs = [
+            dirname for dirname in _SESSION_DIRS if (self.active_dir / dirname).is_dir()
+        ]
+
         if backup_needed:
             # Find a unique backup name
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -262,48 +383,27 @@ class ClaudeAccountManager:
                 backup_name = f"backup_{timestamp}_{counter}"
                 counter += 1
 
-            # Save current credentials as backup
-            self.save_account(backup_name)
+            # Save current credentials as backup; session dirs are cleared next,
+            # so move them into the backup rather than copying
+            self.save_account(backup_name, move_dirs=existing_session_dirs)
 
-        # Clear all credential and session files
-        # These files contain authentication data that needs to be removed
-        credential_files = [
-            ".credentials.json",    # Main credentials file
-            ".claude.json",         # Claude configuration (may contain tokens)
-            "session.json",         # Session data
-            ".session",             # Alternative session file
-        ]
-
-        for filename in credential_files:
-            file_path = self.active_dir / filename
-            if file_path.exists():
-                file_path.unlink()
-
-        # Also clear any backup or corrupted credential files
-        # These may be created by Claude and can contain auth tokens
-        for item in self.active_dir.iterdir():
-            if item.is_file():
-                # Remove backup/corrupted versions of credential files
-                if any(pattern in item.name for pattern in [
-                    ".credentials", ".claude.json", ".session", "session.json"
-                ]) and any(suffix in item.name for suffix in [
-                    ".backup", ".bak", ".old", ".corrupted"
-                ]):
-                    item.unlink()
+        # Clear all credential and session files, plus backup or corrupted
+        # variants Claude may leave behind, in a single directory scan
+        with os.scandir(self.active_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and _is_credential_file(entry.name):
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass  # Already gone, e.g. Claude rotated it mid-scan
 
         # Clear session-related directories
-        session_dirs = [
-            "sessions",         # Active sessions
-            "shell-snapshots",  # Shell session snapshots
-            "statsig",          # Analytics/session tracking
-        ]
-
-        for dirname in session_dirs:
+        for dirname in existing_session_dirs:
             dir_path = self.active_dir / dirname
-            if dir_path.exists() and dir_path.is_dir():
+            if dir_path.exists():
                 shutil.rmtree(dir_path)
-                # Recreate empty directory to maintain structure
-                dir_path.mkdir(parents=True, exist_ok=True)
+            # Recreate empty directory to maintain structure
+            dir_path.mkdir(parents=True, exist_ok=True)
 
         # Clear active account in metadata
         metadata = self._load_metadata()
@@ -323,7 +423,11 @@ class ClaudeAccountManager:
         account_meta = metadata.get("accounts", {}).get(name, {})
 
         creds_file = account_dir / ".credentials.json"
-        has_creds = creds_file.exists()
+        try:
+            creds_mtime = creds_file.stat().st_mtime_ns
+        except OSError:
+            creds_mtime = None
+        has_creds = creds_mtime is not None
 
         info = {
             "name": name,
@@ -338,9 +442,8 @@ class ClaudeAccountManager:
         # Get additional info from credentials if available
         if has_creds:
             try:
-                creds = json.loads(creds_file.read_text())
-                if "claudeAiOauth" in creds:
-                    oauth = creds["claudeAiOauth"]
+                oauth = _read_oauth(str(creds_file), creds_mtime)
+                if oauth is not None:
                     info["subscription_type"] = oauth.get("subscriptionType", "Pro")
                     info["email"] = oauth.get("email", "unknown")
             except Exception:
@@ -350,7 +453,7 @@ class ClaudeAccountManager:
         api_key_file = account_dir / ".api_keys.json"
         if api_key_file.exists():
             try:
-                api_keys = json.loads(api_key_file.read_text())
+                api_keys = self._load_api_keys(name)
                 info["credential_type"] = account_meta.get("credential_type", "oauth")
                 info["has_api_keys"] = True
                 info["api_key_types"] = list(api_keys.keys())
@@ -386,17 +489,15 @@ class ClaudeAccountManager:
 
         # Load or create API keys file
         api_key_file = account_dir / ".api_keys.json"
-        if api_key_file.exists():
-            api_keys = json.loads(api_key_file.read_text())
-        else:
-            api_keys = {}
+        api_keys = self._load_api_keys(name)
 
         # Save credentials based on provider
+        now_iso = datetime.now().isoformat()
         if provider == "anthropic_api":
             api_keys["anthropic"] = {
                 "api_key": api_key,
                 "provider": "anthropic",
-                "created": datetime.now().isoformat()
+                "created": now_iso
             }
         elif provider == "bedrock_api":
             # Support two modes: Bearer token (preferred) or access keys
@@ -407,7 +508,7 @@ class ClaudeAccountManager:
                     "region": region or "us-east-1",
                     "provider": "bedrock",
                     "auth_method": "bearer_token",
-                    "created": datetime.now().isoformat()
+                    "created": now_iso
                 }
             else:
                 # Option B: AWS access keys
@@ -419,12 +520,11 @@ class ClaudeAccountManager:
                     "secret_access_key": secret_access_key,
                     "provider": "bedrock",
                     "auth_method": "access_keys",
-                    "created": datetime.now().isoformat()
+                    "created": now_iso
                 }
 
-        # Save API keys file with restricted permissions
-        api_key_file.write_text(json.dumps(api_keys, indent=2))
-        api_key_file.chmod(0o600)  # User read/write only
+        # Save API keys file, user read/write only (0600)
+        write_json_atomic(api_key_file, api_keys, mode=0o600)
 
         # Update metadata
         metadata = self._load_metadata()
@@ -433,7 +533,7 @@ class ClaudeAccountManager:
 
         if name not in metadata["accounts"]:
             metadata["accounts"][name] = {
-                "created": datetime.now().isoformat(),
+                "created": now_iso,
                 "last_used": "never",
                 "type": "API",
                 "credential_type": provider
@@ -441,10 +541,21 @@ class ClaudeAccountManager:
         else:
             metadata["accounts"][name]["credential_type"] = provider
             metadata["accounts"][name]["type"] = "API"
+            # The stored type no longer matches any OAuth credentials, so make
+            # list_accounts derive it from the credentials file again
+            metadata["accounts"][name].pop("creds_mtime", None)
 
-        self._save_metadata(metadata)
+        self._save_metadata(metadata, now_iso)
         return True
 
+    def _load_api_keys(self, name: str) -> dict[str, Any]:
+        """Parse an account's .api_keys.json, or return {} when it has none."""
+        api_key_file = self.accounts_dir / name / ".api_keys.json"
+        try:
+            return json.loads(api_key_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+
     def get_api_key(self, name: str, provider: str = "anthropic") -> dict[str, Any] | None:
         """Get API key credentials for an account.
 
@@ -455,15 +566,8 @@ class ClaudeAccountManager:
         Returns:
             Dictionary with API key credentials or None
         """
-        account_dir = self.accounts_dir / name
-        api_key_file = account_dir / ".api_keys.json"
-
-        if not api_key_file.exists():
-            return None
-
         try:
-            api_keys = json.loads(api_key_file.read_text())
-            return api_keys.get(provider)
+            return self._load_api_keys(name).get(provider)
         except Exception:
             return None
 
@@ -477,17 +581,14 @@ class ClaudeAccountManager:
         account_dir = self.accounts_dir / name
         api_key_file = account_dir / ".api_keys.json"
 
-        if not api_key_file.exists():
-            return False
-
         try:
-            api_keys = json.loads(api_key_file.read_text())
+            api_keys = self._load_api_keys(name)
             if provider in api_keys:
                 del api_keys[provider]
 
                 if api_keys:
-                    # Still has other API keys
-                    api_key_file.write_text(json.dumps(api_keys, indent=2))
+                    # Still has other API keys; keep the file owner-only
+                    write_json_atomic(api_key_file, api_keys, mode=0o600)
                 else:
                     # No more API keys, remove file
                     api_key_file.unlink()
@@ -507,15 +608,8 @@ class ClaudeAccountManager:
         Returns:
             List of provider names
         """
-        account_dir = self.accounts_dir / name
-        api_key_file = account_dir / ".api_keys.json"
-
-        if not api_key_file.exists():
-            return []
-
         try:
-            api_keys = json.loads(api_key_file.read_text())
-            return list(api_keys.keys())
+            return list(self._load_api_keys(name).keys())
         except Exception:
             return []
 
@@ -531,11 +625,13 @@ class ClaudeAccountManager:
         """
         env_vars = {}
 
-        # Get all API keys for the account
-        providers = self.list_api_keys(name)
+        # Get all API keys for the account from a single read of the file
+        try:
+            api_keys = self._load_api_keys(name)
+        except Exception:
+            api_keys = {}
 
-        for provider in providers:
-            api_key_info = self.get_api_key(name, provider)
+        for provider, api_key_info in api_keys.items():
             if not api_key_info:
                 continue
 
@@ -567,25 +663,13 @@ class ClaudeAccountManager:
 
         return env_vars
 
-    def get_env_vars_to_unset(self) -> list[str]:
-        """Get list of all environment variables that should be unset when switching accounts.
+    def get_env_vars_to_unset(self) -> tuple[str, ...]:
+        """Get all environment variables that should be unset when switching accounts.
 
         Returns:
-            List of environment variable names to unset
+            Tuple of environment variable names to unset
         """
-        return [
-            # Anthropic
-            "ANTHROPIC_API_KEY",
-            # Bedrock
-            "AWS_BEARER_TOKEN_BEDROCK",
-            "AWS_ACCESS_KEY_ID",
-            "AWS_SECRET_ACCESS_KEY",
-            "AWS_REGION",
-            "AWS_SESSION_TOKEN",
-            # Claude Code Bedrock
-            "CLAUDE_CODE_USE_BEDROCK",
-            "ANTHROPIC_SMALL_FAST_MODEL_AWS_REGION",
-        ]
+        return _ENV_VARS_TO_UNSET
 
     def generate_env_script(self, name: str, unset_first: bool = True) -> str:
         """Generate a shell script to export environment variables.
@@ -602,30 +686,24 @@ class ClaudeAccountManager:
         if not env_vars:
             return "# No API keys configured for this account\n"
 
-        lines = [
-            "#!/bin/bash",
-            f"# Environment variables for account: {name}",
-            f"# Generated: {datetime.now().isoformat()}",
-            ""
-        ]
-
         # Optionally unset all variables first to avoid conflicts
-        if unset_first:
-            lines.append("# Unset previous API key variables")
-            for var in self.get_env_vars_to_unset():
-                lines.append(f"unset {var}")
-            lines.append("")
-
-        # Set new variables
-        lines.append("# Set new API key variables")
-        for key, value in env_vars.items():
-            lines.append(f'export {key}="{value}"')
-
-        lines.append("")
-        lines.append("# Verify variables are set")
-        lines.append(f'echo "✓ Environment variables configured for account: {name}"')
-
-        return "\n".join(lines)
+        unset_section = (
+            f"# Unset previous API key variables\n{_UNSET_BLOCK}\n\n" if unset_first else ""
+        )
+        exports = "\n".join(f'export {key}="{value}"' for key, value in env_vars.items())
+
+        return (
+            "#!/bin/bash\n"
+            f"# Environment variables for account: {name}\n"
+            f"# Generated: {datetime.now().isoformat()}\n"
+            "\n"
+            f"{unset_section}"
+            "# Set new API key variables\n"
+            f"{exports}\n"
+            "\n"
+            "# Verify variables are set\n"
+            f'echo "✓ Environment variables configured for account: {name}"'
+        )
 
     def generate_unset_script(self) -> str:
         """Generate a shell script to unset all API key environment variables.
@@ -637,15 +715,12 @@ class ClaudeAccountManager:
             "#!/bin/bash",
             "# Unset all Claude API key environment variables",
             f"# Generated: {datetime.now().isoformat()}",
-            ""
+            "",
+            _UNSET_BLOCK,
+            "",
+            'echo "✓ All Claude API key variables unset"',
         ]
 
-        for var in self.get_env_vars_to_unset():
-            lines.append(f"unset {var}")
-
-        lines.append("")
-        lines.append('echo "✓ All Claude API key variables unset"')
-
         return "\n".join(lines)
 
     def save_env_script(self, name: str) -> Path | None:
@@ -666,7 +741,16 @@ class ClaudeAccountManager:
         account_dir = self.accounts_dir / name
         script_file = account_dir / "env.sh"
 
-        script_file.write_text(script_content)
-        script_file.chmod(0o600)  # User read/write only
+        write_text_atomic(script_file, script_content, mode=0o600)  # User read/write only
 
         return script_file
+
+
+@functools.cache
+def get_account_manager(storage_dir: str | None = None) -> ClaudeAccountManager:
+    """Return a shared ClaudeAccountManager for a storage directory.
+
+    Reusing the instance skips the directory setup in ``__init__`` on repeated
+    status checks.
+    """
+    return ClaudeAccountManager(storage_dir=storage_dir)
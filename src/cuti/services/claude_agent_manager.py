@@ -3,15 +3,97 @@ Claude Code Agent Manager - Reads and manages Claude Code agents from .claude/ag
 """
 
 import asyncio
+import bisect
+import itertools
 import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 import yaml  # type: ignore[import-untyped]
 
+# Keywords looked for in agent prompts, in the order they are reported
+_CAPABILITY_KEYWORDS = (
+    'code review', 'testing', 'documentation', 'refactoring',
+    'debugging', 'security', 'performance', 'design', 'architecture'
+)
+_TOOL_KEYWORDS = ('read', 'write', 'edit', 'bash', 'grep', 'search')
+# Plain substring matches (no word boundaries), like the `in` checks they replace
+_CAPABILITY_PATTERN = re.compile("|".join(map(re.escape, _CAPABILITY_KEYWORDS)), re.IGNORECASE)
+_TOOL_PATTERN = re.compile("|".join(map(re.escape, _TOOL_KEYWORDS)), re.IGNORECASE)
+# Autocomplete never shows more than this many agents
+_MAX_SUGGESTIONS = 8
+# Below this many changed agent files, reading serially beats starting a thread pool
+_PARALLEL_READ_MIN = 4
+# Parse cache key: (mtime_ns, size, is_local, is_builtin, stamp of the packaged
+# built-in with the same name, for local files only)
+_ParseKey = tuple[int, int, bool, bool, tuple[int, int] | None]
+
+
+def _find_keywords(pattern: re.Pattern[str], text: str) -> set[str]:
+    """Return the lowercased keywords matched anywhere in text, in one scan."""
+    return {match.group(0).lower() for match in pattern.finditer(text)}
+
+
+def _scan_agent_files(directory: Path | None) -> list[os.DirEntry[str]]:
+    """List the *.md files in an agents directory with one scandir call."""
+    if directory is None:
+        return []
+    try:
+        with os.scandir(directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(".md") and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _first_description_line(content: str) -> str:
+    """Return the first heading or paragraph line, scanning only as far as needed."""
+    start = 0
+    while start < len(content):
+        end = content.find('\n', start)
+        if end == -1:
+            end = len(content)
+        line = content[start:end].strip()
+        # Dispatch on the first character; only backtick lines need the fence check
+        first = line[:1]
+        if first == '#':
+            # Remove heading markers (same as stripping r'^#+\s*')
+            return line.lstrip('#').lstrip()
+        elif first and (first != '`' or not line.startswith('```')):
+            return line
+        start = end + 1
+    return ""
+
+
+def _read_agent_text(path: Path) -> str:
+    """Read an agent file as UTF-8, normalizing newlines as text mode would."""
+    text = path.read_bytes().decode('utf-8', errors='replace')
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _read_agent_texts(paths: list[Path]) -> dict[Path, str]:
+    """Read agent files, on a thread pool once there are enough to pay for one.
+
+    Files that cannot be read are left out; parsing them again reports the error.
+    """
+
+    def _read(path: Path) -> str | None:
+        try:
+            return _read_agent_text(path)
+        except OSError:
+            return None
+
+    if len(paths) < _PARALLEL_READ_MIN:
+        texts = [_read(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+            texts = list(pool.map(_read, paths))
+    return {path: text for path, text in zip(paths, texts, strict=True) if text is not None}
+
 
 class ClaudeAgent:
     """Represents a Claude Code agent from markdown files."""
@@ -36,34 +118,33 @@ class ClaudeAgent:
         self.is_local = is_local
         self.is_builtin = is_builtin
         self.agent_type = agent_type  # "claude" or "gemini"
-        # Use provided capabilities/tools or extract from prompt
-        self.capabilities = capabilities if capabilities is not None else self._extract_capabilities(prompt)
-        self.tools = tools if tools is not None else self._extract_tools(prompt)
+        # Lowercased once for search and autocomplete
+        self._name_lower = name.lower()
+        self._description_lower = description.lower()
+        # Use provided capabilities/tools; otherwise they are extracted from the
+        # prompt on first access, since most callers never look at them
+        if capabilities is not None:
+            self.capabilities = capabilities
+        if tools is not None:
+            self.tools = tools
+
+    @cached_property
+    def capabilities(self) -> list[str]:
+        return self._extract_capabilities(self.prompt)
+
+    @cached_property
+    def tools(self) -> list[str]:
+        return self._extract_tools(self.prompt)
 
     def _extract_capabilities(self, prompt: str) -> list[str]:
         """Extract capabilities from the agent prompt."""
-        capabilities = []
-        # Look for common capability keywords
-        capability_keywords = [
-            'code review', 'testing', 'documentation', 'refactoring',
-            'debugging', 'security', 'performance', 'design', 'architecture'
-        ]
-        prompt_lower = prompt.lower()
-        for keyword in capability_keywords:
-            if keyword in prompt_lower:
-                capabilities.append(keyword.replace(' ', '-'))
-        return capabilities
+        found = _find_keywords(_CAPABILITY_PATTERN, prompt)
+        return [keyword.replace(' ', '-') for keyword in _CAPABILITY_KEYWORDS if keyword in found]
 
     def _extract_tools(self, prompt: str) -> list[str]:
         """Extract mentioned tools from the agent prompt."""
-        tools = []
-        # Look for tool mentions
-        tool_keywords = ['read', 'write', 'edit', 'bash', 'grep', 'search']
-        prompt_lower = prompt.lower()
-        for tool in tool_keywords:
-            if tool in prompt_lower:
-                tools.append(tool)
-        return tools
+        found = _find_keywords(_TOOL_PATTERN, prompt)
+        return [tool for tool in _TOOL_KEYWORDS if tool in found]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert agent to dictionary."""
@@ -103,6 +184,10 @@ class ClaudeCodeAgentManager:
         except Exception:
             self.builtin_agents_dir = None
         self.agents: dict[str, ClaudeAgent] = {}
+        self._agents_by_name: list[ClaudeAgent] = []
+        self._agent_name_keys: list[str] = []
+        # Parsed agents per file, keyed by _ParseKey
+        self._parse_cache: dict[Path, tuple[_ParseKey, ClaudeAgent]] = {}
         self.gemini_available = self._check_gemini_cli()
         self._ensure_directories()
         self._load_agents()
@@ -130,30 +215,61 @@ class ClaudeCodeAgentManager:
     def _load_agents(self) -> None:
         """Load agents from built-in, global, and local directories."""
         self.agents = {}
+        # Only files seen in this pass stay cached, so deleted agents are dropped
+        previous_cache, self._parse_cache = self._parse_cache, {}
+
+        sources = [
+            # Built-in agents first (lowest priority)
+            *[(entry, False, True) for entry in _scan_agent_files(self.builtin_agents_dir)],
+            # Global agents (medium priority)
+            *[(entry, False, False) for entry in _scan_agent_files(self.global_agents_dir)],
+            # Local agents (highest priority - override others if same name)
+            *[(entry, True, False) for entry in _scan_agent_files(self.local_agents_dir)],
+        ]
 
-        # Load built-in agents first (lowest priority)
-        if self.builtin_agents_dir and self.builtin_agents_dir.exists():
-            for agent_file in self.builtin_agents_dir.glob("*.md"):
-                agent = self._parse_agent_file(agent_file, is_local=False, is_builtin=True)
-                if agent:
-                    self.agents[agent.name] = agent
-
-        # Load global agents (medium priority)
-        if self.global_agents_dir.exists():
-            for agent_file in self.global_agents_dir.glob("*.md"):
-                agent = self._parse_agent_file(agent_file, is_local=False, is_builtin=False)
-                if agent:
-                    self.agents[agent.name] = agent
-
-        # Load local agents (highest priority - override others if same name)
-        if self.local_agents_dir.exists():
-            for agent_file in self.local_agents_dir.glob("*.md"):
-                agent = self._parse_agent_file(agent_file, is_local=True, is_builtin=False)
-                if agent:
-                    # Check if this is a built-in agent in local directory
-                    if self._is_builtin_copy(agent_file):
-                        agent.is_builtin = True
-                    self.agents[agent.name] = agent
+        # Reuse agents whose file is unchanged since the last load
+        planned: list[tuple[Path, _ParseKey, ClaudeAgent | None]] = []
+        for entry, is_local, is_builtin in sources:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            agent_file = Path(entry.path)
+            # A local copy's is_builtin flag depends on the packaged file too
+            builtin_stamp = self._builtin_stamp(agent_file.name) if is_local else None
+            key = (stat.st_mtime_ns, stat.st_size, is_local, is_builtin, builtin_stamp)
+            cached = previous_cache.get(agent_file)
+            planned.append((agent_file, key, cached[1] if cached and cached[0] == key else None))
+
+        # Read the changed files up front so their reads can overlap
+        contents = _read_agent_texts([agent_file for agent_file, _, agent in planned if agent is None])
+
+        for agent_file, key, agent in planned:
+            if agent is None:
+                is_local, is_builtin = key[2], key[3]
+                agent = self._parse_agent_file(
+                    agent_file, is_local=is_local, is_builtin=is_builtin, content=contents.get(agent_file)
+                )
+                # Check if this is a built-in agent in local directory
+                if agent and is_local and self._is_builtin_copy(agent_file):
+                    agent.is_builtin = True
+            if agent:
+                self._parse_cache[agent_file] = (key, agent)
+                self.agents[agent.name] = agent
+
+        # Agents sorted by lowercased name, for prefix lookups with bisect
+        self._agents_by_name = sorted(self.agents.values(), key=lambda agent: agent._name_lower)
+        self._agent_name_keys = [agent._name_lower for agent in self._agents_by_name]
+
+    def _builtin_stamp(self, file_name: str) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) of the built-in agent with this name, if any."""
+        if not self.builtin_agents_dir:
+            return None
+        try:
+            stat = (self.builtin_agents_dir / file_name).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def _is_builtin_copy(self, file_path: Path) -> bool:
         """Check if a local agent file is a copy of a built-in agent."""
@@ -163,16 +279,22 @@ class ClaudeCodeAgentManager:
         if builtin_path.exists():
             # Check if content matches or has builtin flag
             try:
-                content = file_path.read_text()
-                return 'builtin: true' in content or content == builtin_path.read_text()
+                content = file_path.read_bytes()
+                return b'builtin: true' in content or content == builtin_path.read_bytes()
             except Exception:
                 return False
         return False
 
-    def _parse_agent_file(self, file_path: Path, is_local: bool, is_builtin: bool = False) -> ClaudeAgent | None:
-        """Parse an agent markdown file with optional YAML frontmatter."""
+    def _parse_agent_file(
+        self, file_path: Path, is_local: bool, is_builtin: bool = False, content: str | None = None
+    ) -> ClaudeAgent | None:
+        """Parse an agent markdown file with optional YAML frontmatter.
+
+        ``content`` may be passed when the file has already been read.
+        """
         try:
-            content = file_path.read_text()
+            if content is None:
+                content = _read_agent_text(file_path)
             name = file_path.stem
             description = ""
             capabilities = None
@@ -209,16 +331,7 @@ class ClaudeCodeAgentManager:
             else:
                 # No frontmatter, extract description from first heading or paragraph
                 prompt = content
-                lines = content.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('#'):
-                        # Remove heading markers
-                        description = re.sub(r'^#+\s*', '', line)
-                        break
-                    elif line and not line.startswith('```'):
-                        description = line
-                        break
+                description = _first_description_line(content)
 
             return ClaudeAgent(
                 name=name,
@@ -253,8 +366,8 @@ class ClaudeCodeAgentManager:
         results = []
 
         for agent in self.agents.values():
-            if (query_lower in agent.name.lower() or
-                query_lower in agent.description.lower()):
+            if (query_lower in agent._name_lower or
+                query_lower in agent._description_lower):
                 results.append(agent)
 
         return results
@@ -265,7 +378,7 @@ class ClaudeCodeAgentManager:
 
         if prefix == '_all' or prefix == '':
             # Return all agents if no prefix
-            for agent in self.agents.values():
+            for agent in itertools.islice(self.agents.values(), _MAX_SUGGESTIONS):
                 suggestions.append({
                     "name": agent.name,
                     "description": agent.description,
@@ -273,18 +386,21 @@ class ClaudeCodeAgentManager:
                     "is_local": str(agent.is_local)  # Convert boolean to string
                 })
         else:
-            # Filter by prefix
+            # Filter by prefix: matches are contiguous in the sorted name index
             prefix_lower = prefix.lower()
-            for agent in self.agents.values():
-                if agent.name.lower().startswith(prefix_lower):
-                    suggestions.append({
-                        "name": agent.name,
-                        "description": agent.description,
-                        "command": f"@{agent.name}",
-                        "is_local": str(agent.is_local)  # Convert boolean to string
-                    })
-
-        return suggestions[:8]  # Limit to 8 suggestions
+            start = bisect.bisect_left(self._agent_name_keys, prefix_lower)
+            # Slicing jumps straight to start; islice would walk there from index 0
+            for agent in self._agents_by_name[start:start + _MAX_SUGGESTIONS]:
+                if not agent._name_lower.startswith(prefix_lower):
+                    break
+                suggestions.append({
+                    "name": agent.name,
+                    "description": agent.description,
+                    "command": f"@{agent.name}",
+                    "is_local": str(agent.is_local)  # Convert boolean to string
+                })
+
+        return suggestions
 
     async def create_agent_with_claude(self, name: str, description: str) -> dict[str, Any]:
         """Create an agent using Claude Code's /agent command."""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
@@ -43,7 +43,7 @@ class ContainerStateManager:
         workspace_key = str(Path(workspace).resolve())
         entry = self._state.setdefault("workspaces", {}).get(workspace_key, {})
         entry.update(metadata)
-        entry["last_used"] = datetime.utcnow().isoformat()
+        entry["last_used"] = datetime.now(timezone.utc).isoformat()
         entry["workspace"] = workspace_key
         self._state["workspaces"][workspace_key] = entry
         self._save()
@@ -56,7 +56,7 @@ class ContainerStateManager:
     def update_global(self, **metadata: Any) -> None:
         global_state = self._state.setdefault("global", {})
         global_state.update(metadata)
-        global_state["updated_at"] = datetime.utcnow().isoformat()
+        global_state["updated_at"] = datetime.now(timezone.utc).isoformat()
         self._save()
 
     def get_global(self) -> dict[str, Any]:
@@ -42,6 +42,8 @@ class DevContainerService:
     CONTAINER_MODE_CLAUDE = PROVIDER_CONTAINER_MODE_CLAUDE
     CONTAINER_MODE_OPENCLAW = PROVIDER_CONTAINER_MODE_OPENCLAW
     PROVIDER_RUNTIME_CONTAINER_DIR = "/home/cuti/.cuti-providers"
+    # Provider update scripts export their own PATH/HOME, so skip login dotfiles.
+    PROVIDER_UPDATE_SHELL = ("/bin/bash", "--noprofile", "--norc", "-c")
     CLAUDE_PERMISSION_MODE_ENV = "CUTI_CLAUDE_PERMISSION_MODE"
     DEFAULT_CLAUDE_PERMISSION_MODE = "auto"
     CLAUDE_PERMISSION_MODES = {
@@ -456,6 +458,7 @@ CMD ["/bin/zsh", "-l"]
         self._selected_providers_cache: list[str] | None = None
 
         # Check tool availability (cached for CLI compatibility)
+        self._tool_availability: dict[str, bool] = {}
         self.docker_available = self._check_tool_available("docker")
         self.colima_available = self._check_tool_available("colima")
 
@@ -808,12 +811,18 @@ CMD ["/bin/zsh", "-l"]
         return linux_claude_dir, mount_args
 
     def _check_tool_available(self, tool: str) -> bool:
-        """Check if a tool is available."""
+        """Check if a tool is available, reusing earlier probes for this service."""
+        cached = self._tool_availability.get(tool)
+        if cached is not None:
+            return cached
+
         try:
             result = self._run_command([tool, "--version"])
-            return result.returncode == 0
+            available = result.returncode == 0
         except RuntimeError:
-            return False
+            available = False
+        self._tool_availability[tool] = available
+        return available
 
     def _check_colima(self) -> bool:
         """Check if Colima is available (backward compatibility method)."""
@@ -843,6 +852,7 @@ CMD ["/bin/zsh", "-l"]
 
         if result.returncode == 0:
             print(f"✅ {package} installed successfully")
+            self._tool_availability.clear()
             return True
         else:
             print(f"❌ Failed to install {package}")
@@ -865,6 +875,7 @@ CMD ["/bin/zsh", "-l"]
                     )
                     if result.returncode != 0:
                         return False
+                    self._tool_availability.clear()
                 else:
                     return False
 
@@ -911,6 +922,7 @@ CMD ["/bin/zsh", "-l"]
         result = self._run_command(cmd, timeout=120, show_output=True)
         if result.returncode == 0:
             print("✅ Colima started successfully")
+            self._tool_availability.clear()
             return True
         else:
             print("❌ Failed to start Colima")
@@ -1456,8 +1468,7 @@ RUN chmod +x /tmp/container_tools.sh && /tmp/container_tools.sh
         docker_args.extend(
             [
                 self.IMAGE_NAME,
-                "/usr/bin/zsh",
-                "-lc",
+                *self.PROVIDER_UPDATE_SHELL,
                 self._provider_update_shell_command(
                     provider,
                     update_command,
@@ -1481,8 +1492,7 @@ RUN chmod +x /tmp/container_tools.sh && /tmp/container_tools.sh
             "docker",
             "exec",
             container_id,
-            "/usr/bin/zsh",
-            "-lc",
+            *self.PROVIDER_UPDATE_SHELL,
             self._provider_update_shell_command(
                 provider,
                 update_command,
@@ -1592,11 +1602,12 @@ RUN chmod +x /tmp/container_tools.sh && /tmp/container_tools.sh
 
         # Check Docker Desktop file sharing settings on macOS
         if self.is_macos:
-            print("📝 Note: If workspace is read-only, check Docker Desktop settings:")
-            print("   1. Open Docker Desktop → Settings → Resources → File Sharing")
-            print("   2. Ensure your project directory is in the shared paths")
-            print("   3. Try 'osxfs' or 'VirtioFS' file sharing implementation")
-            print("")
+            print(
+                "📝 Note: If workspace is read-only, check Docker Desktop settings:\n"
+                "   1. Open Docker Desktop → Settings → Resources → File Sharing\n"
+                "   2. Ensure your project directory is in the shared paths\n"
+                "   3. Try 'osxfs' or 'VirtioFS' file sharing implementation\n"
+            )
 
         # Build container if needed
         image_name = self.IMAGE_NAME
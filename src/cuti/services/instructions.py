@@ -2,30 +2,41 @@
 
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
+from ..utils.helpers import write_text_atomic
 from .providers import ProviderManager
 
 DEFAULT_INSTRUCTION_FILES: Sequence[str] = ("CLAUDE.md", "AGENTS.md", "TOOLS.md")
 TOOLS_SECTION_HEADER = "## Available CLI Tools"
 
 
+# Matches an existing tools section (plus the newline before it) up to the next
+# second-level heading or the end of the file.
+_TOOLS_SECTION_PATTERN = re.compile(
+    rf"\n?{re.escape(TOOLS_SECTION_HEADER)}.*?(?=\n## |\Z)", re.DOTALL
+)
+
+
 def _build_tools_section(tools: list[dict[str, Any]]) -> str:
-    content = f"\n{TOOLS_SECTION_HEADER}\n\n"
-    content += "The following CLI tools are available in the development environment:\n\n"
+    parts = [
+        f"\n{TOOLS_SECTION_HEADER}\n\n",
+        "The following CLI tools are available in the development environment:\n\n",
+    ]
 
     enabled_tools = [tool for tool in tools if tool.get("enabled") and tool.get("installed")]
     if enabled_tools:
         for tool in enabled_tools:
-            content += f"### {tool['display_name']}\n"
-            content += f"{tool['description']}\n\n"
-            content += f"{tool['usage_instructions']}\n\n"
+            parts.append(f"### {tool['display_name']}\n")
+            parts.append(f"{tool['description']}\n\n")
+            parts.append(f"{tool['usage_instructions']}\n\n")
     else:
-        content += "*No additional CLI tools are currently enabled.*\n\n"
+        parts.append("*No additional CLI tools are currently enabled.*\n\n")
 
-    return content
+    return "".join(parts)
 
 
 def update_instruction_files_with_tools(
@@ -38,6 +49,10 @@ def update_instruction_files_with_tools(
     """Update any existing provider instruction files with the enabled tool list."""
 
     updated_paths: list[Path] = []
+    # Outside the container there is usually no /workspace; skip provider lookups.
+    if not workspace.is_dir():
+        return updated_paths
+
     tools_content = _build_tools_section(tools)
     resolved_files: list[str] = []
     seen = set()
@@ -67,22 +82,20 @@ def update_instruction_files_with_tools(
             continue
 
         content = path.read_text()
-        section_start = content.find(TOOLS_SECTION_HEADER)
-        section_end = content.find("\n## ", section_start + 1) if section_start != -1 else -1
-
-        if section_start != -1:
-            if section_end != -1:
-                new_content = content[:section_start] + tools_content + content[section_end:]
-            else:
-                new_content = content[:section_start] + tools_content
-        else:
+        new_content, replaced = _TOOLS_SECTION_PATTERN.subn(
+            lambda _match: tools_content, content, count=1
+        )
+        if not replaced:
             last_section = content.rfind("\n# ")
             if last_section != -1:
                 new_content = content[:last_section] + "\n" + tools_content + content[last_section:]
             else:
                 new_content = content + "\n" + tools_content
 
-        path.write_text(new_content)
+        if new_content == content:
+            continue
+
+        write_text_atomic(path, new_content)
         updated_paths.append(path)
 
     return updated_paths
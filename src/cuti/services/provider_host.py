@@ -9,7 +9,6 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
-from .claude_account_manager import ClaudeAccountManager
 from .devcontainer import DevContainerService
 from .providers import (
     CONTAINER_MODE_CLAUDE,
@@ -63,6 +62,7 @@ class ProviderHostService:
         self.provider_manager = ProviderManager(storage_dir=provider_storage_dir)
         self.storage_dir = self.provider_manager.storage_dir
         self.home_dir = Path.home()
+        self._devcontainer_services: dict[str, DevContainerService] = {}
 
     def _metadata(self, provider: str) -> ProviderMetadata:
         return self.provider_manager.get_metadata(provider)
@@ -170,7 +170,9 @@ class ProviderHostService:
         return False
 
     def _status_for_claude(self, meta: ProviderMetadata) -> ProviderHostStatus:
-        manager = ClaudeAccountManager(storage_dir=str(self.storage_dir))
+        from .claude_account_manager import get_account_manager
+
+        manager = get_account_manager(str(self.storage_dir))
         state_paths = self._state_paths("claude")
         existing_state_paths = [path for path in state_paths if path.exists()]
         active_account = manager.get_active_account()
@@ -413,25 +415,29 @@ class ProviderHostService:
     def _devcontainer_service(
         self, *, container_mode: str = CONTAINER_MODE_CLAUDE
     ) -> DevContainerService:
-        return DevContainerService(
-            self.working_directory,
-            provider_storage_dir=self.storage_dir,
-            container_mode=container_mode,
-        )
+        # DevContainerService probes docker/colima on construction; reuse one
+        # per container mode so multi-step flows only pay for detection once.
+        service = self._devcontainer_services.get(container_mode)
+        if service is None:
+            service = DevContainerService(
+                self.working_directory,
+                provider_storage_dir=self.storage_dir,
+                container_mode=container_mode,
+            )
+            self._devcontainer_services[container_mode] = service
+        return service
 
     def run_setup(self, provider: str, *, rebuild: bool = False) -> int:
         """Run the provider's interactive setup/auth command inside the container."""
 
-        status = self.get_status(provider)
-        if not status.setup_command:
-            raise ValueError(
-                f"Provider '{status.provider}' does not define a setup command"
-            )
-        self.ensure_enabled(status.provider)
+        meta = self._metadata(provider)
+        if not meta.setup_command:
+            raise ValueError(f"Provider '{meta.name}' does not define a setup command")
+        self.ensure_enabled(meta.name)
         return self._devcontainer_service(
-            container_mode=self._container_mode_for_provider(status.provider)
+            container_mode=self._container_mode_for_provider(meta.name)
         ).run_in_container(
-            command=status.setup_command,
+            command=meta.setup_command,
             rebuild=rebuild,
             interactive=True,
         )
@@ -439,17 +445,17 @@ class ProviderHostService:
     def run_update(self, provider: str, *, rebuild: bool = False) -> int:
         """Run the provider's update command inside the container."""
 
-        status = self.get_status(provider)
-        if not status.update_command:
+        meta = self._metadata(provider)
+        if not meta.update_command:
             raise ValueError(
-                f"Provider '{status.provider}' does not define an update command"
+                f"Provider '{meta.name}' does not define an update command"
             )
-        self.ensure_enabled(status.provider)
+        self.ensure_enabled(meta.name)
         return self._devcontainer_service(
-            container_mode=self._container_mode_for_provider(status.provider)
+            container_mode=self._container_mode_for_provider(meta.name)
         ).run_provider_update(
-            status.provider,
-            status.update_command,
+            meta.name,
+            meta.update_command,
             rebuild=rebuild,
         )
 
@@ -464,16 +470,14 @@ class ProviderHostService:
     ) -> int:
         """Run a provider CLI command inside the cuti cloud container."""
 
-        status = self.get_status(provider)
-        if not status.commands:
-            raise ValueError(
-                f"Provider '{status.provider}' does not define a CLI command"
-            )
+        meta = self._metadata(provider)
+        if not meta.commands:
+            raise ValueError(f"Provider '{meta.name}' does not define a CLI command")
 
-        self.ensure_enabled(status.provider)
-        command = shlex.join([status.commands[0], *args])
+        self.ensure_enabled(meta.name)
+        command = shlex.join([meta.commands[0], *args])
         return self._devcontainer_service(
-            container_mode=self._container_mode_for_provider(status.provider)
+            container_mode=self._container_mode_for_provider(meta.name)
         ).run_in_container(
             command=command,
             rebuild=rebuild,
@@ -492,15 +496,13 @@ class ProviderHostService:
     ) -> int:
         """Run a provider-specific shell command inside the cuti cloud container."""
 
-        status = self.get_status(provider)
-        if not status.commands:
-            raise ValueError(
-                f"Provider '{status.provider}' does not define a CLI command"
-            )
+        meta = self._metadata(provider)
+        if not meta.commands:
+            raise ValueError(f"Provider '{meta.name}' does not define a CLI command")
 
-        self.ensure_enabled(status.provider)
+        self.ensure_enabled(meta.name)
         return self._devcontainer_service(
-            container_mode=self._container_mode_for_provider(status.provider)
+            container_mode=self._container_mode_for_provider(meta.name)
         ).run_in_container(
             command=command,
             rebuild=rebuild,
@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from ..utils.helpers import write_text_atomic
+
 CONTAINER_MODE_CLAUDE = "claude-code"
 CONTAINER_MODE_OPENCLAW = "openclaw"
 KNOWN_CONTAINER_MODES = (CONTAINER_MODE_CLAUDE, CONTAINER_MODE_OPENCLAW)
@@ -128,8 +130,9 @@ class ProviderManager:
         self._providers = decoded if isinstance(decoded, dict) else {}
 
     def _save(self) -> None:
-        self.config_path.write_text(
-            json.dumps(self._providers, indent=2, sort_keys=True)
+        # Write to a sibling temp file and rename so readers never see a torn file.
+        write_text_atomic(
+            self.config_path, json.dumps(self._providers, indent=2, sort_keys=True)
         )
 
     def _canonical_name(self, provider: str) -> str:
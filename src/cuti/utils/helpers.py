@@ -2,7 +2,12 @@
 Helper functions and utilities for cuti.
 """
 
+import json
+import os
 import re
+import stat
+import tempfile
+from pathlib import Path
 from typing import Any
 
 
@@ -31,6 +36,63 @@ def safe_filename(text: str, max_length: int = 50) -> str:
     return text[:max_length]
 
 
+def _read_umask() -> int:
+    """Return the process umask; os.umask can only read it by setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import, before any threads start, since reading it briefly
+# changes the process-wide umask
+_NEW_FILE_MODE = 0o666 & ~_read_umask()
+
+
+def write_text_atomic(path: Path, content: str, mode: int | None = None) -> None:
+    """Replace a file's content in a single rename.
+
+    Every atomic file write in cuti goes through here. Mode policy: with
+    ``mode`` the file always ends up with exactly that mode (pass 0o600 for
+    credentials); without it an existing file keeps its current mode and a
+    new file gets 0666 minus the umask, as open() would give it. The temp
+    file is chmodded before any content is written, so a 0600 file is never
+    readable by others, even briefly.
+    Symlinks are resolved first so a link keeps pointing at its target.
+
+    Args:
+        path: Destination file
+        content: Text to write
+        mode: Permission bits to force, or None to keep the existing mode
+    """
+    path = path.resolve()
+    if mode is None:
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE
+    payload = content.encode()
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), mode)
+            f.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def write_json_atomic(path: Path, data: Any, mode: int | None = None) -> None:
+    """Write data as indented JSON via write_text_atomic.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable value
+        mode: Passed through to write_text_atomic
+    """
+    write_text_atomic(path, json.dumps(data, indent=2), mode)
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to human readable format.
 
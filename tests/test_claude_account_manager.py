@@ -0,0 +1,262 @@
+"""Tests for saved Claude account storage."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+from cuti.services.claude_account_manager import (
+    ClaudeAccountManager,
+    get_account_manager,
+)
+
+
+def _manager_with_active_creds(tmp_path: Path) -> ClaudeAccountManager:
+    manager = ClaudeAccountManager(storage_dir=str(tmp_path / ".cuti"))
+    (manager.active_dir / ".credentials.json").write_text(
+        json.dumps({"claudeAiOauth": {"subscriptionType": "max"}})
+    )
+    return manager
+
+
+def test_metadata_reads_follow_external_edits(tmp_path: Path) -> None:
+    manager = _manager_with_active_creds(tmp_path)
+    manager.save_account("work")
+
+    metadata = manager._load_metadata()
+    metadata["accounts"]["work"]["type"] = "mutated"
+    assert manager._load_metadata()["accounts"]["work"]["type"] == "Max"
+
+    manager.metadata_file.write_text(
+        json.dumps({"accounts": {}, "active": "elsewhere", "last_updated": "x"})
+    )
+
+    assert manager.get_active_account() == "elsewhere"
+
+
+def test_list_accounts_reparses_credentials_only_after_they_change(
+    tmp_path: Path,
+) -> None:
+    manager = _manager_with_active_creds(tmp_path)
+    manager.save_account("work")
+    saved_creds = manager.accounts_dir / "work" / ".credentials.json"
+
+    assert manager.list_accounts()[0]["type"] == "Max"
+
+    saved_creds.write_text(
+        json.dumps({"claudeAiOauth": {"subscriptionType": "enterprise-plan"}})
+    )
+    mtime_ns = saved_creds.stat().st_mtime_ns + 1_000_000_000
+    os.utime(saved_creds, ns=(mtime_ns, mtime_ns))
+
+    assert manager.list_accounts()[0]["type"] == "Enterprise-plan"
+
+
+def test_new_account_moves_session_dirs_into_backup(tmp_path: Path) -> None:
+    manager = _manager_with_active_creds(tmp_path)
+    (manager.active_dir / "sessions").mkdir()
+    (manager.active_dir / "sessions" / "one.json").write_text("{}")
+    (manager.active_dir / "settings.json").write_text("{}")
+    (manager.active_dir / ".credentials.json.bak").write_text("{}")
+    (manager.active_dir / ".claude.json").write_text("{}")
+
+    assert manager.new_account() is True
+
+    backup = next(manager.accounts_dir.glob("backup_*"))
+    assert (backup / "sessions" / "one.json").exists()
+    assert (backup / ".credentials.json").exists()
+    assert list((manager.active_dir / "sessions").iterdir()) == []
+    assert not (manager.active_dir / ".credentials.json").exists()
+    assert not (manager.active_dir / ".credentials.json.bak").exists()
+    assert not (manager.active_dir / ".claude.json").exists()
+    assert (manager.active_dir / "settings.json").exists()
+    assert manager.get_active_account() is None
+
+
+def test_new_account_clears_symlinked_credential_files(tmp_path: Path) -> None:
+    manager = ClaudeAccountManager(storage_dir=str(tmp_path / ".cuti"))
+    target = tmp_path / "shared.json"
+    target.write_text("{}")
+    (manager.active_dir / ".claude.json").symlink_to(target)
+
+    manager.new_account()
+
+    assert not (manager.active_dir / ".claude.json").is_symlink()
+    assert target.exists()
+
+
+def test_get_account_manager_is_shared_per_storage_dir(tmp_path: Path) -> None:
+    first = get_account_manager(str(tmp_path / "a"))
+
+    assert get_account_manager(str(tmp_path / "a")) is first
+    assert get_account_manager(str(tmp_path / "b")) is not first
+
+
+def test_get_account_info_reads_credentials_again_after_rewrite(
+    tmp_path: Path,
+) -> None:
+    manager = _manager_with_active_creds(tmp_path)
+    manager.save_account("work")
+    saved_creds = manager.accounts_dir / "work" / ".credentials.json"
+
+    assert manager.get_account_info("work")["subscription_type"] == "max"
+
+    saved_creds.write_text(
+        json.dumps({"claudeAiOauth": {"subscriptionType": "pro", "email": "a@b.c"}})
+    )
+    mtime_ns = saved_creds.stat().st_mtime_ns + 1_000_000_000
+    os.utime(saved_creds, ns=(mtime_ns, mtime_ns))
+
+    info = manager.get_account_info("work")
+    assert (info["subscription_type"], info["email"]) == ("pro", "a@b.c")
+
+
+def test_save_account_strips_unsafe_name_characters(tmp_path: Path) -> None:
+    manager = _manager_with_active_creds(tmp_path)
+
+    manager.save_account(" wörk/../team_1-a! ")
+
+    assert manager.get_active_account() == "wörkteam_1-a"
+    assert (manager.accounts_dir / "wörkteam_1-a" / ".credentials.json").exists()
+
+
+def test_use_account_restores_every_saved_file(tmp_path: Path) -> None:
+    manager = _manager_with_active_creds(tmp_path)
+    for name in ("settings.json", "statsig", "todos"):
+        (manager.active_dir / name).write_text(name)
+    (manager.active_dir / "sessions").mkdir()
+    (manager.active_dir / "sessions" / "one.json").write_text("{}")
+    manager.save_account("work")
+    manager.new_account()
+
+    assert manager.use_account("work") is True
+
+    restored = {p.name for p in manager.active_dir.iterdir()}
+    assert {".credentials.json", "settings.json", "statsig", "todos", "sessions"} <= restored
+    assert (manager.active_dir / "sessions" / "one.json").exists()
+
+
+def test_list_accounts_prefers_oauth_type_over_api_keys(tmp_path: Path) -> None:
+    manager = _manager_with_active_creds(tmp_path)
+    manager.save_account("work")
+    (manager.accounts_dir / "work" / ".api_keys.json").write_text("{}")
+
+    [account] = manager.list_accounts()
+
+    assert (account["type"], account["has_credentials"]) == ("Max", True)
+
+
+def test_list_accounts_keeps_oauth_type_after_api_key_is_added(tmp_path: Path) -> None:
+    manager = _manager_with_active_creds(tmp_path)
+    manager.save_account("work")
+    manager.save_api_key("work", "sk-test")
+
+    [account] = manager.list_accounts()
+
+    assert account["type"] == "Max"
+
+
+def test_list_accounts_derives_missing_types_without_writing(
+    tmp_path: Path,
+) -> None:
+    manager = _manager_with_active_creds(tmp_path)
+    manager.save_account("work")
+    metadata = json.loads(manager.metadata_file.read_text())
+    del metadata["accounts"]["work"]["creds_mtime"]
+    manager.metadata_file.write_text(json.dumps(metadata))
+    before = manager.metadata_file.read_bytes()
+
+    assert manager.list_accounts()[0]["type"] == "Max"
+
+    assert manager.metadata_file.read_bytes() == before
+
+
+def test_get_env_vars_covers_every_saved_provider(tmp_path: Path) -> None:
+    manager = ClaudeAccountManager(storage_dir=str(tmp_path / ".cuti"))
+    manager.save_api_key("api", "sk-test")
+    manager.save_api_key("api", "token", provider="bedrock_api", region="eu-west-1")
+
+    assert manager.get_env_vars("api") == {
+        "ANTHROPIC_API_KEY": "sk-test",
+        "AWS_BEARER_TOKEN_BEDROCK": "token",
+        "AWS_REGION": "eu-west-1",
+        "CLAUDE_CODE_USE_BEDROCK": "1",
+    }
+    assert manager.get_env_vars("missing") == {}
+
+
+def test_generate_env_script_unsets_then_exports(tmp_path: Path) -> None:
+    manager = ClaudeAccountManager(storage_dir=str(tmp_path / ".cuti"))
+    manager.save_api_key("api", "sk-test")
+
+    lines = manager.generate_env_script("api").splitlines()
+
+    assert lines[0] == "#!/bin/bash"
+    assert lines[4:6] == ["# Unset previous API key variables", "unset ANTHROPIC_API_KEY"]
+    assert lines[-4:] == [
+        'export ANTHROPIC_API_KEY="sk-test"',
+        "",
+        "# Verify variables are set",
+        'echo "✓ Environment variables configured for account: api"',
+    ]
+
+
+def test_api_key_reads_follow_saves_and_deletes(tmp_path: Path) -> None:
+    manager = ClaudeAccountManager(storage_dir=str(tmp_path / ".cuti"))
+    manager.save_api_key("api", "sk-one")
+    assert manager.get_api_key("api")["api_key"] == "sk-one"
+
+    manager.save_api_key("api", "sk-two")
+    manager.save_api_key("api", "token", provider="bedrock_api")
+    assert manager.get_api_key("api")["api_key"] == "sk-two"
+    assert manager.list_api_keys("api") == ["anthropic", "bedrock"]
+
+    assert manager.delete_api_key("api", "anthropic") is True
+    assert manager.list_api_keys("api") == ["bedrock"]
+    assert manager.delete_api_key("api", "anthropic") is False
+
+
+def test_api_key_and_env_script_files_are_owner_only(tmp_path: Path) -> None:
+    manager = ClaudeAccountManager(storage_dir=str(tmp_path / ".cuti"))
+    manager.save_api_key("api", "sk-test")
+
+    script = manager.save_env_script("api")
+
+    for path in (manager.accounts_dir / "api" / ".api_keys.json", script):
+        assert path.stat().st_mode & 0o777 == 0o600
+    assert "export ANTHROPIC_API_KEY=" in script.read_text()
+
+
+def test_list_accounts_survives_deleted_storage_dir(tmp_path: Path) -> None:
+    storage = tmp_path / ".cuti"
+    manager = get_account_manager(str(storage))
+    shutil.rmtree(storage)
+
+    assert manager.list_accounts() == []
+
+
+def test_metadata_writes_follow_umask_and_keep_existing_mode(tmp_path: Path) -> None:
+    manager = ClaudeAccountManager(storage_dir=str(tmp_path / ".cuti"))
+    manager.metadata_file.unlink()
+    umask = os.umask(0)
+    os.umask(umask)
+    manager._save_metadata({"accounts": {}})
+    assert manager.metadata_file.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    manager.metadata_file.chmod(0o640)
+    manager._save_metadata({"accounts": {}})
+    assert manager.metadata_file.stat().st_mode & 0o777 == 0o640
+
+
+def test_manager_recreates_deleted_storage_dir(tmp_path: Path) -> None:
+    storage = tmp_path / ".cuti"
+    ClaudeAccountManager(storage_dir=str(storage))
+    shutil.rmtree(storage)
+
+    manager = ClaudeAccountManager(storage_dir=str(storage))
+
+    assert manager.active_dir.is_dir()
+    assert manager.get_active_account() is None
+    assert manager.metadata_file.exists()
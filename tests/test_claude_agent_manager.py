@@ -0,0 +1,117 @@
+"""Tests for Claude Code agent loading and lookup."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from cuti.services.claude_agent_manager import ClaudeAgent, ClaudeCodeAgentManager
+
+
+@pytest.fixture
+def agent_manager(tmp_path: Path, monkeypatch) -> ClaudeCodeAgentManager:
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.delenv("CLAUDE_CONFIG_DIR", raising=False)
+    return ClaudeCodeAgentManager(working_directory=str(tmp_path / "project"))
+
+
+def test_agent_keywords_are_matched_case_insensitively_in_keyword_order() -> None:
+    agent = ClaudeAgent(
+        "reviewer",
+        prompt="Architecture and Code Review. Use GREP to search; run testing.",
+    )
+
+    assert agent.capabilities == ["code-review", "testing", "architecture"]
+    assert agent.tools == ["grep", "search"]
+
+
+def test_agent_keywords_are_only_extracted_when_needed(monkeypatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(
+        ClaudeAgent, "_extract_tools", lambda self, prompt: calls.append(prompt) or []
+    )
+
+    agent = ClaudeAgent("helper", prompt="Use bash.", capabilities=["testing"])
+
+    assert calls == []
+    assert agent.to_dict()["capabilities"] == ["testing"]
+    assert calls == ["Use bash."]
+
+
+def test_reload_only_reparses_changed_agent_files(agent_manager, monkeypatch) -> None:
+    agent_file = agent_manager.local_agents_dir / "notes.md"
+    agent_file.write_text("# Takes notes\n")
+    agent_manager.reload_agents()
+
+    parsed: list[str] = []
+    original = ClaudeCodeAgentManager._parse_agent_file
+
+    def _tracking_parse(self, file_path, *args, **kwargs):
+        parsed.append(file_path.name)
+        return original(self, file_path, *args, **kwargs)
+
+    monkeypatch.setattr(ClaudeCodeAgentManager, "_parse_agent_file", _tracking_parse)
+    agent_manager.reload_agents()
+    assert parsed == []
+
+    agent_file.write_text("# Takes better notes\n")
+    mtime_ns = agent_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(agent_file, ns=(mtime_ns, mtime_ns))
+    agent_manager.reload_agents()
+
+    assert parsed == ["notes.md"]
+    assert agent_manager.get_agent("notes").description == "Takes better notes"
+
+
+def test_local_copy_flag_follows_changes_to_the_builtin(agent_manager, tmp_path) -> None:
+    builtin_dir = tmp_path / "builtin"
+    builtin_dir.mkdir()
+    builtin_file = builtin_dir / "helper.md"
+    builtin_file.write_text("# Helps\n")
+    (agent_manager.local_agents_dir / "helper.md").write_text("# Helps\n")
+    agent_manager.builtin_agents_dir = builtin_dir
+    agent_manager.reload_agents()
+    assert agent_manager.get_agent("helper").is_builtin is True
+
+    builtin_file.write_text("# Helps more\n")
+    mtime_ns = builtin_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(builtin_file, ns=(mtime_ns, mtime_ns))
+    agent_manager.reload_agents()
+
+    assert agent_manager.get_agent("helper").is_builtin is False
+
+
+def test_crlf_agent_files_parse_without_carriage_returns(agent_manager) -> None:
+    (agent_manager.local_agents_dir / "windows.md").write_bytes(
+        b"---\r\nname: windows\r\ndescription: Edited on Windows\r\n---\r\n"
+        b"Line one.\r\nLine two.\r\n"
+    )
+    agent_manager.reload_agents()
+
+    agent = agent_manager.get_agent("windows")
+    assert agent.description == "Edited on Windows"
+    assert agent.prompt == "Line one.\nLine two."
+
+
+def test_prefix_suggestions_are_case_insensitive(agent_manager) -> None:
+    for name in ("Tester", "test-writer", "docs", "toaster"):
+        (agent_manager.local_agents_dir / f"{name}.md").write_text(f"# {name}\n")
+    agent_manager.reload_agents()
+
+    suggestions = agent_manager.get_agent_suggestions("TE")
+
+    assert [s["command"] for s in suggestions] == ["@test-writer", "@Tester"]
+    assert [a.name for a in agent_manager.search_agents("DOC")] == ["docs"]
+
+
+def test_suggestions_stop_at_eight(agent_manager) -> None:
+    for index in range(10):
+        (agent_manager.local_agents_dir / f"agent-{index}.md").write_text("# agent\n")
+    agent_manager.reload_agents()
+
+    assert len(agent_manager.get_agent_suggestions("")) == 8
+    assert [s["name"] for s in agent_manager.get_agent_suggestions("agent")] == [
+        f"agent-{index}" for index in range(8)
+    ]
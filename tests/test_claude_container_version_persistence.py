@@ -443,10 +443,12 @@ def test_run_provider_update_updates_persistent_runtime_and_active_containers(
         f"{tmp_path / '.cuti' / 'provider-runtimes'}:/home/cuti/.cuti-providers:rw"
         in docker_run
     )
-    assert docker_run[-4:] == [
+    assert docker_run[-6:] == [
         service.IMAGE_NAME,
-        "/usr/bin/zsh",
-        "-lc",
+        "/bin/bash",
+        "--noprofile",
+        "--norc",
+        "-c",
         docker_run[-1],
     ]
     assert "export HOME=/home/cuti/.cuti-providers/claude" in docker_run[-1]
@@ -581,3 +583,26 @@ def test_build_container_image_places_no_cache_before_context(
 
     build_cmd = next(cmd for cmd in commands if cmd[:2] == ["docker", "build"])
     assert build_cmd[-2] == "--no-cache"
+
+
+def test_tool_availability_probes_are_reused_until_install(
+    monkeypatch, tmp_path: Path
+) -> None:
+    service = DevContainerService(tmp_path, provider_storage_dir=tmp_path / ".cuti")
+    probes: list[list[str]] = []
+
+    def _fake_run_command(cmd, timeout=30, show_output=False):
+        probes.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(service, "_run_command", _fake_run_command)
+    service._tool_availability.clear()
+
+    assert service._check_docker() is True
+    assert service._check_tool_available("docker") is True
+    assert probes == [["docker", "--version"]]
+
+    assert service._install_with_brew("colima") is True
+    assert service._check_docker() is True
+    assert probes[-1] == ["docker", "--version"]
+    assert len(probes) == 3
@@ -72,3 +72,54 @@ def test_instruction_updates_keep_existing_standard_files_in_sync(tmp_path) -> N
     assert agents_md in updated
     assert TOOLS_SECTION_HEADER in claude_md.read_text()
     assert TOOLS_SECTION_HEADER in agents_md.read_text()
+
+
+def test_instruction_updates_replace_existing_section_in_place(tmp_path) -> None:
+    claude_md = tmp_path / "CLAUDE.md"
+    claude_md.write_text(
+        "# Claude\n\n## Available CLI Tools\n\nStale.\n\n## Notes\n\nKeep me.\n"
+    )
+    tools = _enabled_tool()
+    tools[0]["usage_instructions"] = r"Use `fd '.*\.py$'`."
+
+    update_instruction_files_with_tools(
+        tools, workspace=tmp_path, instruction_files=["CLAUDE.md"]
+    )
+    first = claude_md.read_text()
+    second_updates = update_instruction_files_with_tools(
+        tools, workspace=tmp_path, instruction_files=["CLAUDE.md"]
+    )
+
+    assert second_updates == []
+    assert claude_md.read_text() == first
+    assert first.count(TOOLS_SECTION_HEADER) == 1
+    assert r"Use `fd '.*\.py$'`." in first
+    assert "Stale." not in first
+    assert first.endswith("## Notes\n\nKeep me.\n")
+
+
+def test_instruction_updates_preserve_file_mode(tmp_path) -> None:
+    agents_md = tmp_path / "AGENTS.md"
+    agents_md.write_text("# Agents\n")
+    agents_md.chmod(0o640)
+
+    update_instruction_files_with_tools(
+        _enabled_tool(), workspace=tmp_path, instruction_files=["AGENTS.md"]
+    )
+
+    assert TOOLS_SECTION_HEADER in agents_md.read_text()
+    assert agents_md.stat().st_mode & 0o777 == 0o640
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["AGENTS.md"]
+
+
+def test_instruction_updates_skip_missing_workspace(tmp_path) -> None:
+    provider_storage = tmp_path / ".cuti"
+
+    updated = update_instruction_files_with_tools(
+        _enabled_tool(),
+        workspace=tmp_path / "missing",
+        provider_storage_dir=provider_storage,
+    )
+
+    assert updated == []
+    assert not provider_storage.exists()
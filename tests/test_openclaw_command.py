@@ -273,3 +273,35 @@ def test_openclaw_up_onboards_when_state_missing(monkeypatch) -> None:
             "interactive": True,
         },
     ]
+
+
+def test_openclaw_up_reuses_provider_host_service(monkeypatch) -> None:
+    instances: list[object] = []
+
+    class _FakeProviderHostService:
+        def __init__(self):
+            instances.append(self)
+
+        def get_status(self, provider):
+            return SimpleNamespace(setup_state="ready")
+
+        def run_provider_command(
+            self,
+            provider,
+            args,
+            rebuild=False,
+            interactive=False,
+            mount_docker_socket=True,
+        ):
+            return 0
+
+    monkeypatch.setattr(
+        "cuti.cli.commands.openclaw.ProviderHostService", _FakeProviderHostService
+    )
+
+    first = CliRunner().invoke(app, ["up"])
+    second = CliRunner().invoke(app, ["up"])
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert len(instances) == 2
@@ -0,0 +1,62 @@
+"""Tests for prompt prefix persistence."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from cuti.core.prompt_prefix import PromptPrefixManager
+
+
+def _prefix(name: str) -> dict[str, object]:
+    return {"name": name, "description": "", "prompt": "Be brief.", "tools": []}
+
+
+def test_prefix_reads_follow_saves_and_external_edits(tmp_path: Path) -> None:
+    manager = PromptPrefixManager(config_dir=tmp_path)
+
+    manager.save_custom_prefix(_prefix("short"))
+    manager.get_custom_prefixes().append(_prefix("mutated"))
+    assert [p["name"] for p in manager.get_custom_prefixes()] == ["short"]
+
+    manager.custom_prefixes_file.write_text(json.dumps([_prefix("edited-by-hand")]))
+    assert [p["name"] for p in manager.get_custom_prefixes()] == ["edited-by-hand"]
+
+    manager.save_active_prefix(_prefix("short"))
+    assert manager.get_active_prefix()["name"] == "short"
+
+
+def test_templates_are_loaded_once_and_returned_as_copies(tmp_path: Path) -> None:
+    manager = PromptPrefixManager(config_dir=tmp_path)
+
+    templates = manager.get_templates()
+    templates[0]["name"] = "mutated"
+
+    assert templates
+    assert all(t["is_template"] for t in manager.get_templates())
+    assert manager.get_templates()[0]["name"] != "mutated"
+
+
+def test_save_active_prefix_leaves_no_temp_files(tmp_path: Path) -> None:
+    manager = PromptPrefixManager(config_dir=tmp_path)
+
+    assert manager.save_active_prefix({"name": "minimal"}) is True
+
+    assert manager.get_active_prefix() == {"name": "minimal"}
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "custom_prefixes.json",
+        "prompt_prefix.json",
+    ]
+
+
+def test_unchanged_custom_prefix_is_not_rewritten(tmp_path: Path) -> None:
+    manager = PromptPrefixManager(config_dir=tmp_path)
+    prefix = {"name": "mine", "description": "", "prompt": "Be brief.", "tools": []}
+    manager.save_custom_prefix(prefix)
+    before = manager.custom_prefixes_file.stat().st_ino
+
+    assert manager.save_custom_prefix(dict(prefix)) is True
+    assert manager.delete_custom_prefix("missing") is True
+
+    assert manager.custom_prefixes_file.stat().st_ino == before
+    assert manager.get_custom_prefixes() == [prefix]
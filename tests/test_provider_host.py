@@ -248,3 +248,32 @@ def test_run_provider_command_invokes_container_with_provider_cli(
             "mount_docker_socket": True,
         },
     ]
+
+
+def test_provider_commands_reuse_devcontainer_service(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    instances: list[object] = []
+
+    class _FakeDevContainerService:
+        def __init__(
+            self, working_directory=None, provider_storage_dir=None, container_mode=None
+        ):
+            instances.append(container_mode)
+
+        def run_in_container(
+            self, command=None, rebuild=False, interactive=False, **kwargs
+        ):
+            return 0
+
+    monkeypatch.setattr(
+        "cuti.services.provider_host.DevContainerService", _FakeDevContainerService
+    )
+
+    service = ProviderHostService(provider_storage_dir=tmp_path / ".cuti")
+    service.run_provider_command("openclaw", ["doctor"])
+    service.run_provider_command("openclaw", ["gateway"])
+    service.run_provider_shell_command("openclaw", "openclaw status")
+
+    assert instances == ["openclaw"]
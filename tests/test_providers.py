@@ -85,3 +85,15 @@ def test_unknown_provider_raises_clean_error(tmp_path) -> None:
 
     with pytest.raises(ValueError, match="Unknown provider 'unknown-provider'"):
         manager.get_metadata("unknown-provider")
+
+
+def test_save_replaces_config_without_leaving_temp_files(tmp_path) -> None:
+    manager = ProviderManager(storage_dir=tmp_path)
+
+    manager.set_enabled("codex", True)
+    manager.set_enabled("opencode", True)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["providers.json"]
+    reloaded = ProviderManager(storage_dir=tmp_path)
+    assert reloaded.is_enabled("codex") is True
+    assert reloaded.is_enabled("opencode") is True
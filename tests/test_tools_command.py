@@ -0,0 +1,137 @@
+"""Tests for the CLI tools command surface."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from cuti.cli.commands import tools
+from cuti.services.tool_catalog import (
+    check_tool_installed,
+    get_tools_config_path,
+    load_tools_config,
+    save_tools_config,
+)
+
+
+@pytest.fixture
+def tools_env(monkeypatch):
+    """Keep tool config and probes in memory for each test."""
+
+    state: dict[str, Any] = {
+        "config": {"enabled_tools": [], "auto_install": []},
+        "probes": [],
+        "updates": [],
+    }
+
+    def _check(check_command: str) -> bool:
+        state["probes"].append(check_command)
+        return True
+
+    def _save(config: dict[str, Any]) -> None:
+        state["config"] = config
+
+    monkeypatch.setattr(tools, "check_tool_installed", _check)
+    monkeypatch.setattr(tools, "load_tools_config", lambda: dict(state["config"]))
+    monkeypatch.setattr(tools, "save_tools_config", _save)
+    monkeypatch.setattr(
+        tools, "update_instruction_files_with_tools", state["updates"].append
+    )
+    tools._is_installed.cache_clear()
+    yield state
+    tools._is_installed.cache_clear()
+
+
+def test_enable_probes_each_tool_once(tools_env) -> None:
+    result = CliRunner().invoke(tools.app, ["enable", "jq"])
+
+    assert result.exit_code == 0
+    assert tools_env["config"]["enabled_tools"] == ["jq"]
+    assert tools_env["probes"] == ["jq --version"]
+    assert [tool["display_name"] for tool in tools_env["updates"][0]] == ["jq"]
+
+
+def test_list_only_probes_tools_in_requested_category(tools_env) -> None:
+    result = CliRunner().invoke(tools.app, ["list", "--category", "testing"])
+
+    assert result.exit_code == 0
+    assert sorted(tools_env["probes"]) == [
+        "cypress --version",
+        "k6 version",
+        "playwright --version",
+    ]
+
+
+def test_install_success_does_not_reprobe_installed_tool(
+    tools_env, monkeypatch
+) -> None:
+    tools_env["config"] = {"enabled_tools": ["ripgrep"], "auto_install": []}
+    probes: list[str] = tools_env["probes"]
+
+    def _check(check_command: str) -> bool:
+        probes.append(check_command)
+        return check_command != "jq --version"
+
+    monkeypatch.setattr(tools, "check_tool_installed", _check)
+    monkeypatch.setattr(
+        tools.subprocess,
+        "run",
+        lambda *args, **kwargs: SimpleNamespace(returncode=0, stderr=""),
+    )
+
+    result = CliRunner().invoke(tools.app, ["install", "jq"])
+
+    assert result.exit_code == 0
+    assert sorted(probes) == ["jq --version", "rg --version"]
+    assert sorted(tool["display_name"] for tool in tools_env["updates"][0]) == [
+        "Ripgrep (rg)",
+        "jq",
+    ]
+
+
+def test_check_tool_installed_matches_any_alternative_on_path(
+    tmp_path, monkeypatch
+) -> None:
+    binary = tmp_path / "fdfind"
+    binary.write_text("#!/bin/sh\nexit 0\n")
+    binary.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    assert check_tool_installed("fd --version || fdfind --version") is True
+    assert check_tool_installed("rg --version") is False
+
+
+def test_tools_config_reads_follow_file_changes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    save_tools_config({"enabled_tools": ["jq"], "auto_install": []})
+    loaded = load_tools_config()
+    loaded["enabled_tools"].append("fd")
+
+    assert load_tools_config()["enabled_tools"] == ["jq"]
+
+    get_tools_config_path().write_text(
+        '{"enabled_tools": ["ripgrep", "tree"], "auto_install": ["tree"]}'
+    )
+
+    assert load_tools_config() == {
+        "enabled_tools": ["ripgrep", "tree"],
+        "auto_install": ["tree"],
+    }
+
+
+def test_setup_auto_activation_appends_once(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    bashrc = tmp_path / ".bashrc"
+    bashrc.write_text("export EDITOR=vim\n")
+
+    tools.setup_auto_activation()
+    tools.setup_auto_activation()
+
+    content = bashrc.read_text()
+    assert content.startswith("export EDITOR=vim\n")
+    assert content.count(str(tmp_path / ".cuti" / "auto_activate.sh")) == 2
+    assert content.count("# Cuti workspace tools auto-activation") == 1